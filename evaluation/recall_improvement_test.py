@@ -32,7 +32,7 @@ sys.path.insert(0, _root)
 
 from dotenv import load_dotenv
 
-from rag_pipeline import RAGPipeline
+from rag_pipeline import RAGPipeline, format_context
 from extractor import TripleExtractor
 import extractor as ext_module
 from validator import OntologyValidator
@@ -260,7 +260,7 @@ def run_single_test(test_case, rag_result, extractor, validator,
 
     answer = rag_result["answer"]
     source_documents = rag_result["source_documents"]
-    context_text = "\n\n".join([doc.page_content for doc in source_documents])
+    context_text = format_context(source_documents)
 
     # Save original prompts
     orig_answer_prompt = ext_module.EXTRACTION_SYSTEM_PROMPT
@@ -14,7 +14,10 @@ logical hallucinations in RAG-generated financial text.
 import os
 import sys
 import argparse
+import asyncio
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional
 
@@ -23,13 +26,37 @@ sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src
 
 from dotenv import load_dotenv
 
-from rag_pipeline import RAGPipeline
-from extractor import TripleExtractor
+from rag_pipeline import RAGPipeline, MAX_BATCH_QUESTIONS, format_context
+from extractor import TripleExtractor, EXTRACTION_SYSTEM_PROMPT, CONTEXT_EXTRACTION_PROMPT
 from validator import OntologyValidator
+from result_cache import ResultCache, canonical_triples, ontology_fingerprint
+from console import log, flush_log, set_verbose, stop_log
+from rate_limiter import RateLimiter
 
 # Maximum number of correction attempts before hard-reject
 MAX_CORRECTION_ATTEMPTS = 3
 
+# Upper bound on questions processed at once by process_queries()
+DEFAULT_QUERY_CONCURRENCY = 8
+
+# Console separators and banners (each banner is written as one log line,
+# which also keeps it together when concurrent queries log)
+_SEP = "=" * 70
+_INIT_BANNER = f"{_SEP}\nONTOLOGY-VALIDATED RAG SYSTEM\n{_SEP}\nInitializing components...\n"
+_QUERY_BANNER = f"\n{_SEP}\nQUERY PROCESSING\n{_SEP}"
+_SUMMARY_BANNER = f"\n{_SEP}\nSUMMARY\n{_SEP}"
+_INTERACTIVE_BANNER = f"""
+{_SEP}
+INTERACTIVE MODE
+{_SEP}
+Enter queries to test the OV-RAG system.
+Commands:
+  'quit' or 'exit' - Exit the program
+  'info' - Show system information
+  'batch:' - Enter several queries, one per line, ending with an empty line
+             (answered together, {MAX_BATCH_QUESTIONS} per LLM call)
+{_SEP}"""
+
 
 class OVRAGSystem:
     """
@@ -39,10 +66,28 @@ class OVRAGSystem:
     can detect logical inconsistencies in LLM-generated financial text.
     """
 
+    # Correction candidates requested per failed attempt. Values > 1 fire
+    # speculative rewrites in parallel and keep the first one that validates
+    # (lower latency on hard cases, at the cost of extra API calls).
+    correction_variants = 1
+
+    # Optional persistent cache of extraction/validation results (see
+    # result_cache.py); None disables caching.
+    result_cache = None
+    rate_limiter = None
+    _ontology_fingerprint = ""
+
     def __init__(
         self,
         ontology_dir: str = "ontologies",
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        correction_variants: int = 1,
+        cache_dir: Optional[str] = None,
+        rpm: Optional[float] = None,
+        tpm: Optional[float] = None,
+        cache_answers: bool = False,
+        extractor_model: str = "gpt-4o",
+        vector_store_dir: Optional[str] = None
     ):
         """
         Initialize the OV-RAG system.
@@ -50,27 +95,59 @@ class OVRAGSystem:
         Args:
             ontology_dir: Directory containing FIBO ontology files
             api_key: OpenAI API key (optional)
+            correction_variants: Parallel correction candidates per failed attempt
+            cache_dir: Directory for the persistent result cache (None = off)
+            rpm: OpenAI requests-per-minute limit to stay under (None = off)
+            tpm: OpenAI tokens-per-minute limit to stay under (None = off)
+            cache_answers: Also cache generated answers in the result cache,
+                so repeated prompts skip the LLM (off by default: at the
+                default temperature this replaces fresh samples with the
+                first answer)
+            extractor_model: OpenAI model for triple extraction (a smaller
+                model such as gpt-4o-mini is faster and cheaper)
+            vector_store_dir: Directory for persistent vector stores, so a
+                document set is embedded once (None = in-memory only)
         """
+        self.correction_variants = correction_variants
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError(
                 "OpenAI API key not found. Set OPENAI_API_KEY environment variable."
             )
 
-        print("="*70)
-        print("ONTOLOGY-VALIDATED RAG SYSTEM")
-        print("="*70)
-        print("Initializing components...")
-        print()
+        log(_INIT_BANNER)
+
+        # One limiter shared by generation and extraction, since both count
+        # against the same account limits
+        if rpm or tpm:
+            self.rate_limiter = RateLimiter(rpm=rpm, tpm=tpm)
 
         # Initialize all three components
-        self.rag = RAGPipeline(api_key=self.api_key)
-        self.extractor = TripleExtractor(api_key=self.api_key)
+        self.rag = RAGPipeline(
+            api_key=self.api_key,
+            rate_limiter=self.rate_limiter,
+            persist_dir=vector_store_dir,
+        )
+        self.extractor = TripleExtractor(
+            api_key=self.api_key, model=extractor_model, rate_limiter=self.rate_limiter
+        )
         self.validator = OntologyValidator(ontology_dir=ontology_dir)
+        # Index the ontology while documents load, not on the first query
+        self.validator.start_warm_up()
 
-        print()
-        print("[OK] System ready")
-        print("="*70)
+        if cache_dir:
+            self.result_cache = ResultCache(cache_dir)
+            self._ontology_fingerprint = ontology_fingerprint(
+                ontology_dir, [str(self.validator.CACHE_FILE)]
+            )
+            log(f"[OK] Result cache: {cache_dir}")
+            if cache_answers:
+                self.rag.answer_cache = self.result_cache
+                log("[OK] Answer caching enabled")
+
+        log()
+        log("[OK] System ready")
+        log(_SEP)
 
     def load_documents(self, pdf_paths: List[str]) -> int:
         """
@@ -84,7 +161,13 @@ class OVRAGSystem:
         """
         return self.rag.load_documents(pdf_paths)
 
-    def process_query(self, question: str, validate: bool = True) -> dict:
+    def process_query(
+        self,
+        question: str,
+        validate: bool = True,
+        answer: Optional[str] = None,
+        source_documents: Optional[list] = None,
+    ) -> dict:
         """
         Process a query through the complete OV-RAG pipeline with correction loop.
 
@@ -98,15 +181,15 @@ class OVRAGSystem:
         Args:
             question: User question
             validate: Whether to run ontology validation
+            answer: Initial answer already generated (e.g. by process_batch);
+                skips generation
+            source_documents: Chunks already retrieved for question;
+                skips retrieval
 
         Returns:
             Dict with answer, triples, validation results, and correction info
         """
-        print("\n" + "="*70)
-        print("QUERY PROCESSING")
-        print("="*70)
-        print(f"Question: {question}")
-        print()
+        log(f"{_QUERY_BANNER}\nQuestion: {question}\n")
 
         _t_start = time.time()
         _t_rag = 0.0
@@ -114,57 +197,103 @@ class OVRAGSystem:
         _t_validation = 0.0
 
         # Step 1: Generate initial answer using RAG
-        print("[1/3] Generating answer with RAG...")
+        log("[1/3] Generating answer with RAG...")
         _t0 = time.time()
-        rag_result = self.rag.query(question)
-        _t_rag += time.time() - _t0
-        answer = rag_result["answer"]
-        source_documents = rag_result["source_documents"]
+        if source_documents is None:
+            source_documents = self.rag.retrieve(question)
+
+        # Built once; generation, context extraction and every correction
+        # attempt use the same context block
+        context_text = format_context(source_documents)
+
+        # Context extraction only needs the retrieved chunks, so it starts
+        # right after retrieval and runs while the answer is being generated
+        pool = ThreadPoolExecutor(max_workers=1)
+        try:
+            if validate:
+                # Extract triples from source documents to detect answer-vs-source clashes
+                context_future = pool.submit(self._extract_from_context, context_text)
+
+            if answer is None:
+                answer = self.rag.generate(question, source_documents, context=context_text)
+            _t_rag += time.time() - _t0
+
+            result = {
+                "question": question,
+                "answer": answer,
+                "sources": source_documents,
+                "triples": [],
+                "validation": None,
+                "correction_attempts": [],
+                "hard_reject": False,
+                "hard_reject_reason": None,
+                "total_attempts": 1,
+                "accepted_at_attempt": None,
+            }
 
-        result = {
-            "question": question,
-            "answer": answer,
-            "sources": source_documents,
-            "triples": [],
-            "validation": None,
-            "correction_attempts": [],
-            "hard_reject": False,
-            "hard_reject_reason": None,
-            "total_attempts": 1,
-            "accepted_at_attempt": None,
-        }
+            if not validate:
+                result["latency_rag"] = _t_rag
+                result["latency_extraction"] = 0.0
+                result["latency_validation"] = 0.0
+                result["latency_total"] = time.time() - _t_start
+                return result
 
-        if not validate:
-            result["latency_rag"] = _t_rag
-            result["latency_extraction"] = 0.0
-            result["latency_validation"] = 0.0
-            result["latency_total"] = time.time() - _t_start
-            return result
-
-        # === Context Extraction (once, before correction loop) ===
-        # Extract triples from source documents to detect answer-vs-source clashes
-        context_text = "\n\n".join([doc.page_content for doc in source_documents])
-        print("\n" + "="*70)
-        print("[1.5/3] Extracting context triples from source documents...")
-        _t0 = time.time()
-        context_extraction = self.extractor.extract_from_context(context_text)
-        _t_extraction += time.time() - _t0
+            # === Context Extraction (once, before correction loop) ===
+            log("\n" + _SEP)
+            log("[1.5/3] Extracting context triples from source documents...")
+            # Time spent waiting here; the part overlapped with generation
+            # is already covered by latency_rag
+            _t0 = time.time()
+            # Extraction of the initial answer does not depend on the context
+            # triples either, so it runs alongside
+            initial_extraction = self._extract_triples(answer)
+            context_extraction = context_future.result()
+            _t_extraction += time.time() - _t0
+        finally:
+            pool.shutdown(wait=False)
         context_triples = context_extraction.triples if context_extraction.success else []
 
         # === Extract-Validate Loop ===
-        # Attempt 0 = initial answer, attempts 1..MAX = corrections
-        current_answer = answer
+        # Attempt 0 = initial answer, attempts 1..MAX = corrections.
+        # Each attempt checks one or more candidate answers (variant 0 plus
+        # correction_variants - 1 speculative rewrites); the first candidate
+        # that validates is accepted, otherwise variant 0 drives the next step.
+        candidates = [(0, answer)]
 
         for attempt in range(MAX_CORRECTION_ATTEMPTS + 1):
             attempt_label = "initial" if attempt == 0 else f"correction {attempt}"
-            print("\n" + "="*70)
-            print(f"[2/3] Extracting triples ({attempt_label})...")
-            _t0 = time.time()
-            extraction_result = self.extractor.extract_triples(current_answer)
-            _t_extraction += time.time() - _t0
+            outcomes = self._check_candidates(
+                candidates, context_triples, attempt_label,
+                initial_extraction if attempt == 0 else None,
+            )
+
+            for outcome in outcomes:
+                _t_extraction += outcome["latency_extraction"]
+                _t_validation += outcome["latency_validation"]
+                if outcome["validation"] is None:
+                    continue
+                # Log this attempt
+                result["correction_attempts"].append({
+                    "attempt_number": attempt,
+                    "variant_id": outcome["variant_id"],
+                    "answer": outcome["answer"],
+                    "triples": outcome["triples"],
+                    "is_valid": outcome["validation"].is_valid,
+                    "explanation": outcome["validation"].explanation,
+                })
+
+            accepted = next(
+                (o for o in outcomes if o["validation"] is not None and o["validation"].is_valid),
+                None,
+            )
+            primary = accepted or next(o for o in outcomes if o["variant_id"] == 0)
+            current_answer = primary["answer"]
+            extraction_result = primary["extraction"]
+            triples = primary["triples"]
+            validation_result = primary["validation"]
 
             if not extraction_result.success:
-                print(f"[X] Extraction failed: {extraction_result.error}")
+                log(f"[X] Extraction failed: {extraction_result.error}")
                 result["answer"] = current_answer
                 result["total_attempts"] = attempt + 1
                 result["latency_rag"] = _t_rag
@@ -173,12 +302,10 @@ class OVRAGSystem:
                 result["latency_total"] = time.time() - _t_start
                 return result
 
-            answer_triples = extraction_result.triples
-
-            if not answer_triples and not context_triples:
-                print("[i] No triples extracted - skipping validation")
+            if validation_result is None:
+                log("[i] No triples extracted - skipping validation")
                 result["answer"] = current_answer
-                result["triples"] = answer_triples
+                result["triples"] = extraction_result.triples
                 result["total_attempts"] = attempt + 1
                 result["latency_rag"] = _t_rag
                 result["latency_extraction"] = _t_extraction
@@ -186,29 +313,6 @@ class OVRAGSystem:
                 result["latency_total"] = time.time() - _t_start
                 return result
 
-            # Merge answer triples with context triples for combined validation
-            triples = self._merge_triples(answer_triples, context_triples)
-
-            # Validate against LOAN ontology
-            print("\n" + "="*70)
-            print(f"[3/3] Validating against LOAN ontology ({attempt_label})...")
-            _t0 = time.time()
-            validation_result = self.validator.validate_text_answer(
-                current_answer,
-                triples
-            )
-            _t_validation += time.time() - _t0
-
-            # Log this attempt
-            attempt_log = {
-                "attempt_number": attempt,
-                "answer": current_answer,
-                "triples": triples,
-                "is_valid": validation_result.is_valid,
-                "explanation": validation_result.explanation,
-            }
-            result["correction_attempts"].append(attempt_log)
-
             if validation_result.is_valid:
                 # Accepted
                 result["answer"] = current_answer
@@ -226,18 +330,18 @@ class OVRAGSystem:
             # Validation failed
             if attempt < MAX_CORRECTION_ATTEMPTS:
                 # Still have correction attempts left
-                print(f"\n[!] Validation failed ({attempt_label}). "
+                log(f"\n[!] Validation failed ({attempt_label}). "
                       f"Requesting correction ({attempt + 1}/{MAX_CORRECTION_ATTEMPTS})...")
                 _t0 = time.time()
-                correction_result = self.rag.query_with_correction(
+                candidates = self._request_corrections(
                     question=question,
                     previous_answer=current_answer,
                     validation_feedback=validation_result.explanation,
                     attempt_number=attempt + 1,
                     source_documents=source_documents,
+                    context=context_text,
                 )
                 _t_rag += time.time() - _t0
-                current_answer = correction_result["answer"]
             else:
                 # All correction attempts exhausted → Hard-Reject
                 result["answer"] = current_answer
@@ -262,6 +366,269 @@ class OVRAGSystem:
         result["latency_total"] = time.time() - _t_start
         return result
 
+    def _cached(self, key_parts: tuple, is_cacheable, fn, *args):
+        """
+        Return fn(*args), served from result_cache when enabled.
+
+        Only results for which is_cacheable(result) holds are stored, so
+        transient failures (API errors, reasoner crashes) are retried.
+        """
+        if self.result_cache is None:
+            return fn(*args)
+        key = ResultCache.make_key(*key_parts)
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            log(f"  [cache] {key_parts[0]} result reused")
+            return cached
+        value = fn(*args)
+        if is_cacheable(value):
+            self.result_cache.set(key, value)
+        return value
+
+    def _extract_triples(self, text: str):
+        """Cached TripleExtractor.extract_triples."""
+        return self._cached(
+            ("extract", self.extractor.model, EXTRACTION_SYSTEM_PROMPT, text),
+            lambda r: r.success,
+            self.extractor.extract_triples, text,
+        )
+
+    def _extract_from_context(self, context_text: str):
+        """Cached TripleExtractor.extract_from_context."""
+        return self._cached(
+            ("context", self.extractor.model, CONTEXT_EXTRACTION_PROMPT, context_text),
+            lambda r: r.success,
+            self.extractor.extract_from_context, context_text,
+        )
+
+    def _validate(self, answer: str, triples: list):
+        """
+        Cached OntologyValidator.validate_text_answer (keyed on the triples).
+
+        Only verdicts backed by a full reasoner run are stored; a "valid"
+        reached because the reasoner could not run is recomputed next time.
+        """
+        return self._cached(
+            # "v2": entries stored before reasoning_complete existed may hold
+            # verdicts from failed reasoner runs
+            ("validate", "v2", canonical_triples(triples), self._ontology_fingerprint),
+            lambda r: r.reasoning_complete,
+            self.validator.validate_text_answer, answer, triples,
+        )
+
+    def _check_candidate(
+        self,
+        variant_id: int,
+        answer: str,
+        context_triples: list,
+        attempt_label: str,
+        extraction_result=None,
+        cancelled: Optional[threading.Event] = None,
+    ) -> dict:
+        """
+        Extract and validate one candidate answer.
+
+        extraction_result may be passed in when the extraction already ran.
+        "validation" is None when extraction failed or found no triples, or
+        when `cancelled` was set before the candidate got that far.
+        """
+        if variant_id:
+            attempt_label = f"{attempt_label}, variant {variant_id}"
+        outcome = {
+            "variant_id": variant_id,
+            "answer": answer,
+            "extraction": extraction_result,
+            "triples": [],
+            "validation": None,
+            "latency_extraction": 0.0,
+            "latency_validation": 0.0,
+        }
+
+        if cancelled is not None and cancelled.is_set():
+            return outcome
+
+        log("\n" + _SEP)
+        log(f"[2/3] Extracting triples ({attempt_label})...")
+        if extraction_result is None:
+            _t0 = time.time()
+            extraction_result = self._extract_triples(answer)
+            outcome["latency_extraction"] = time.time() - _t0
+            outcome["extraction"] = extraction_result
+
+        if not extraction_result.success:
+            return outcome
+        if not extraction_result.triples and not context_triples:
+            return outcome
+
+        # Merge answer triples with context triples for combined validation
+        triples = self._merge_triples(extraction_result.triples, context_triples)
+        outcome["triples"] = triples
+        if cancelled is not None and cancelled.is_set():
+            return outcome
+
+        # Validate against LOAN ontology
+        log("\n" + _SEP)
+        log(f"[3/3] Validating against LOAN ontology ({attempt_label})...")
+        _t0 = time.time()
+        outcome["validation"] = self._validate(answer, triples)
+        outcome["latency_validation"] = time.time() - _t0
+        return outcome
+
+    def _check_candidates(
+        self,
+        candidates: list,
+        context_triples: list,
+        attempt_label: str,
+        extraction_result=None,
+    ) -> list:
+        """
+        Check (variant_id, answer) candidates, stopping at the first valid one.
+
+        Several candidates are checked concurrently (validation itself is
+        serialized by the validator). Once a candidate validates, the others
+        skip their remaining extraction/validation step; a call already in
+        flight still runs to completion. Returns the outcomes collected up
+        to the first valid one.
+        """
+        if len(candidates) == 1:
+            variant_id, answer = candidates[0]
+            return [self._check_candidate(
+                variant_id, answer, context_triples, attempt_label, extraction_result
+            )]
+
+        outcomes = []
+        cancelled = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=len(candidates))
+        try:
+            futures = [
+                pool.submit(
+                    self._check_candidate, variant_id, answer, context_triples,
+                    attempt_label, cancelled=cancelled,
+                )
+                for variant_id, answer in candidates
+            ]
+            for future in as_completed(futures):
+                outcome = future.result()
+                outcomes.append(outcome)
+                if outcome["validation"] is not None and outcome["validation"].is_valid:
+                    cancelled.set()
+                    break
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return sorted(outcomes, key=lambda o: o["variant_id"])
+
+    def _request_corrections(
+        self,
+        question: str,
+        previous_answer: str,
+        validation_feedback: str,
+        attempt_number: int,
+        source_documents: list,
+        context: Optional[str] = None,
+    ) -> list:
+        """
+        Request correction_variants rewrites of a rejected answer in parallel.
+
+        Variant 0 uses the pipeline's own temperature; speculative variants
+        use increasing temperatures to diversify the rewrites.
+
+        Returns:
+            List of (variant_id, answer) candidates
+        """
+        kwargs = dict(
+            question=question,
+            previous_answer=previous_answer,
+            validation_feedback=validation_feedback,
+            attempt_number=attempt_number,
+            source_documents=source_documents,
+            context=context,
+        )
+        n_variants = max(1, self.correction_variants)
+        if n_variants == 1:
+            return [(0, self.rag.query_with_correction(**kwargs)["answer"])]
+
+        with ThreadPoolExecutor(max_workers=n_variants) as pool:
+            futures = [
+                pool.submit(
+                    self.rag.query_with_correction,
+                    temperature=None if i == 0 else min(1.0, 0.3 + 0.2 * i),
+                    **kwargs,
+                )
+                for i in range(n_variants)
+            ]
+            return [(i, f.result()["answer"]) for i, f in enumerate(futures)]
+
+    async def aprocess_query(self, question: str, validate: bool = True) -> dict:
+        """
+        Awaitable variant of process_query.
+
+        The pipeline components use blocking OpenAI/LangChain clients, so the
+        query runs in a worker thread; this keeps the event loop free and lets
+        several queries overlap their network round-trips.
+        """
+        return await asyncio.to_thread(self.process_query, question, validate)
+
+    async def aprocess_queries(
+        self,
+        questions: List[str],
+        validate: bool = True,
+        max_concurrency: int = DEFAULT_QUERY_CONCURRENCY,
+    ) -> List[dict]:
+        """
+        Process several questions concurrently.
+
+        At most max_concurrency queries are in flight at once (to stay below
+        API rate limits). Ontology validation is serialized inside the
+        validator, so only the LLM calls overlap.
+
+        Returns:
+            Results in the same order as questions
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(question: str) -> dict:
+            async with semaphore:
+                return await self.aprocess_query(question, validate)
+
+        return await asyncio.gather(*(_bounded(q) for q in questions))
+
+    def process_queries(
+        self,
+        questions: List[str],
+        validate: bool = True,
+        max_concurrency: int = DEFAULT_QUERY_CONCURRENCY,
+    ) -> List[dict]:
+        """Synchronous wrapper around aprocess_queries()."""
+        return asyncio.run(self.aprocess_queries(questions, validate, max_concurrency))
+
+    def process_batch(self, questions: List[str], validate: bool = True) -> List[dict]:
+        """
+        Answer several questions with one marshaled LLM call per batch.
+
+        Questions are retrieved individually, then answered in groups of
+        up to MAX_BATCH_QUESTIONS by a single generation request. Each
+        answer then goes through the usual extract/validate/correct loop;
+        the loops of one group run concurrently. Questions whose batch
+        answer could not be parsed fall back to a normal generation.
+
+        Returns:
+            Results in the same order as questions
+        """
+        results = []
+        for start in range(0, len(questions), MAX_BATCH_QUESTIONS):
+            group = questions[start:start + MAX_BATCH_QUESTIONS]
+            log(f"\n{_SEP}\nBATCH: answering {len(group)} question(s) in one request\n{_SEP}")
+            sources_list = [self.rag.retrieve(q) for q in group]
+            answers = self.rag.generate_batch(group, sources_list)
+
+            with ThreadPoolExecutor(max_workers=min(len(group), DEFAULT_QUERY_CONCURRENCY)) as pool:
+                futures = [
+                    pool.submit(self.process_query, q, validate, a, sources)
+                    for q, a, sources in zip(group, answers, sources_list)
+                ]
+                results.extend(f.result() for f in futures)
+        return results
+
     def _merge_triples(self, answer_triples: list, context_triples: list) -> list:
         """
         Merge answer triples with context triples, deduplicating by (sub, pred, obj).
@@ -285,65 +652,59 @@ class OVRAGSystem:
                 merged.append(triple)
                 added_from_context += 1
 
-        print(f"  Merged triples: {len(answer_triples)} answer + "
+        log(f"  Merged triples: {len(answer_triples)} answer + "
               f"{added_from_context} unique context = {len(merged)} total")
         return merged
 
     def _print_summary(self, result: dict):
         """Print a summary of the processing results."""
-        print("\n" + "="*70)
-        print("SUMMARY")
-        print("="*70)
-        print(f"Question: {result['question']}")
-        print()
-        print(f"Answer: {result['answer']}")
-        print()
-        print(f"Triples Extracted: {len(result['triples'])}")
-        print(f"Total Attempts: {result['total_attempts']}")
+        log(_SUMMARY_BANNER)
+        log(f"Question: {result['question']}")
+        log()
+        log(f"Answer: {result['answer']}")
+        log()
+        log(f"Triples Extracted: {len(result['triples'])}")
+        log(f"Total Attempts: {result['total_attempts']}")
 
         # Correction loop info
         if result['correction_attempts']:
-            print()
-            print("Correction Loop:")
+            log()
+            log("Correction Loop:")
             for attempt in result['correction_attempts']:
                 attempt_num = attempt['attempt_number']
                 label = "Initial" if attempt_num == 0 else f"Correction {attempt_num}"
+                if attempt.get('variant_id'):
+                    label += f", variant {attempt['variant_id']}"
                 status = "PASS" if attempt['is_valid'] else "FAIL"
-                print(f"  Attempt {attempt_num} ({label}): {status}")
+                log(f"  Attempt {attempt_num} ({label}): {status}")
 
         if result['validation']:
-            print()
+            log()
             if result['hard_reject']:
-                print("[X] HARD-REJECT")
-                print(f"  {result['hard_reject_reason']}")
+                log("[X] HARD-REJECT")
+                log(f"  {result['hard_reject_reason']}")
             elif result['validation'].is_valid:
                 accepted = result.get('accepted_at_attempt', 0)
                 if accepted == 0:
-                    print("[OK] VALIDATION: PASSED (first attempt)")
+                    log("[OK] VALIDATION: PASSED (first attempt)")
                 else:
-                    print(f"[OK] VALIDATION: PASSED (after {accepted} correction(s))")
-                print("  The answer is logically consistent with LOAN ontology")
+                    log(f"[OK] VALIDATION: PASSED (after {accepted} correction(s))")
+                log("  The answer is logically consistent with LOAN ontology")
             else:
-                print("[X] VALIDATION: FAILED")
-                print("  Logical inconsistency detected!")
-                print()
-                print(result['validation'].explanation)
+                log("[X] VALIDATION: FAILED")
+                log("  Logical inconsistency detected!")
+                log()
+                log(result['validation'].explanation)
 
-        print("="*70)
+        log(_SEP)
 
     def interactive_mode(self):
         """Run the system in interactive CLI mode."""
-        print("\n" + "="*70)
-        print("INTERACTIVE MODE")
-        print("="*70)
-        print("Enter queries to test the OV-RAG system.")
-        print("Commands:")
-        print("  'quit' or 'exit' - Exit the program")
-        print("  'info' - Show system information")
-        print("="*70)
+        log(_INTERACTIVE_BANNER)
 
         while True:
-            print()
+            log()
+            flush_log()
             try:
                 question = input("Query> ").strip()
 
@@ -351,31 +712,56 @@ class OVRAGSystem:
                     continue
 
                 if question.lower() in ["quit", "exit", "q"]:
-                    print("Goodbye!")
+                    log("Goodbye!")
                     break
 
                 if question.lower() == "info":
                     self._print_info()
                     continue
 
+                if question.lower().startswith("batch:"):
+                    questions = [question[len("batch:"):].strip()]
+                    while True:
+                        line = input("...> ").strip()
+                        if not line:
+                            break
+                        questions.append(line)
+                    questions = [q for q in questions if q]
+                    if questions:
+                        self.process_batch(questions)
+                    continue
+
                 # Process the query
                 self.process_query(question)
 
             except KeyboardInterrupt:
-                print("\n\nInterrupted. Goodbye!")
+                log("\n\nInterrupted. Goodbye!")
                 break
             except Exception as e:
-                print(f"\n[X] Error: {type(e).__name__}: {str(e)}")
+                log(f"\n[X] Error: {type(e).__name__}: {str(e)}")
 
     def _print_info(self):
         """Print system information."""
-        print()
-        print("System Information:")
-        print(f"  RAG Model: {self.rag.model}")
-        print(f"  Temperature: {self.rag.temperature}")
-        print(f"  Top-k: {self.rag.top_k}")
-        print(f"  Extractor Model: {self.extractor.model}")
-        print(f"  Ontology Directory: {self.validator.ontology_dir}")
+        log()
+        log("System Information:")
+        log(f"  RAG Model: {self.rag.model}")
+        log(f"  Temperature: {self.rag.temperature}")
+        log(f"  Top-k: {self.rag.top_k}")
+        log(f"  Extractor Model: {self.extractor.model}")
+        log(f"  Ontology Directory: {self.validator.ontology_dir}")
+        rag_stats = getattr(self.rag, "stats", None)
+        if rag_stats:
+            log(f"  Queries: {rag_stats['queries']} "
+                  f"({rag_stats['retrieval_hits']} served from retrieval cache)")
+        if self.result_cache is not None:
+            cache = self.result_cache
+            log(f"  Result Cache: {cache.cache_dir} "
+                  f"({cache.hits} hit(s), {cache.misses} miss(es), "
+                  f"hit rate {cache.hit_rate:.0%})")
+        if self.rate_limiter is not None:
+            limiter = self.rate_limiter
+            log(f"  Rate Limit: {limiter.rpm or '-'} RPM / {limiter.tpm or '-'} TPM "
+                  f"({limiter.waited:.1f}s waited, {limiter.retries} retry(ies))")
 
 
 def main():
@@ -397,6 +783,9 @@ Examples:
   # Single query mode
   python main.py --query "Who owns ACME Corporation?"
 
+  # Several queries, processed concurrently
+  python main.py --query "Who is the borrower?" "Who is the lender?"
+
   # Skip validation (RAG only)
   python main.py --no-validate
         """
@@ -410,8 +799,15 @@ Examples:
 
     parser.add_argument(
         "--query",
-        type=str,
-        help="Single query to process (skip interactive mode)"
+        nargs="+",
+        help="Query (or queries) to process (skip interactive mode)"
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_QUERY_CONCURRENCY,
+        help=f"Max queries in flight with several --query values (default: {DEFAULT_QUERY_CONCURRENCY})"
     )
 
     parser.add_argument(
@@ -420,6 +816,55 @@ Examples:
         help="Skip ontology validation (RAG only)"
     )
 
+    parser.add_argument(
+        "--correction-variants",
+        type=int,
+        default=1,
+        help="Parallel correction candidates per failed validation (default: 1)"
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        help="Reuse extraction/validation results cached in this directory, e.g. "
+             ".ovrag_cache (default: off, every run calls the model and reasoner)"
+    )
+
+    parser.add_argument(
+        "--vector-store-dir",
+        help="Persist vector stores here and reuse them for the same documents "
+             "(default: in-memory only)"
+    )
+
+    parser.add_argument(
+        "--extractor-model",
+        default="gpt-4o",
+        help="OpenAI model for triple extraction (default: gpt-4o)"
+    )
+
+    parser.add_argument(
+        "--cache-answers",
+        action="store_true",
+        help="Reuse cached LLM answers for identical prompts (needs --cache-dir)"
+    )
+
+    parser.add_argument(
+        "--rpm",
+        type=float,
+        help="OpenAI requests-per-minute limit to stay under (default: no limit)"
+    )
+
+    parser.add_argument(
+        "--tpm",
+        type=float,
+        help="OpenAI tokens-per-minute limit to stay under (default: no limit)"
+    )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Also print extracted triples and raw LLM extraction responses"
+    )
+
     parser.add_argument(
         "--ontology-dir",
         default="ontologies",
@@ -427,16 +872,18 @@ Examples:
     )
 
     args = parser.parse_args()
+    if args.verbose:
+        set_verbose()
 
     # Check for API key
     if not os.getenv("OPENAI_API_KEY"):
-        print("[X] Error: OPENAI_API_KEY not set")
-        print()
-        print("Set your OpenAI API key:")
-        print("  export OPENAI_API_KEY='your-key-here'")
-        print()
-        print("Or create a .env file:")
-        print("  OPENAI_API_KEY=your-key-here")
+        log("[X] Error: OPENAI_API_KEY not set")
+        log()
+        log("Set your OpenAI API key:")
+        log("  export OPENAI_API_KEY='your-key-here'")
+        log()
+        log("Or create a .env file:")
+        log("  OPENAI_API_KEY=your-key-here")
         sys.exit(1)
 
     # Check for ontology files (if validation enabled)
@@ -444,10 +891,10 @@ Examples:
         ontology_path = Path(args.ontology_dir)
         # Check for LOAN ontology files in subdirectories
         if not ontology_path.exists() or not any(ontology_path.glob("**/*.rdf")):
-            print("[X] Error: LOAN ontology files not found")
-            print()
-            print("Ensure your LOAN ontology files are in the ontologies directory")
-            print("Expected structure: ontologies/loans general module/*.rdf")
+            log("[X] Error: LOAN ontology files not found")
+            log()
+            log("Ensure your LOAN ontology files are in the ontologies directory")
+            log("Expected structure: ontologies/loans general module/*.rdf")
             sys.exit(1)
 
     # Determine which documents to load
@@ -455,45 +902,70 @@ Examples:
         pdf_paths = args.docs
     else:
         data_dir = Path("data")
-        pdf_files = list(data_dir.glob("*.pdf"))
+        pdf_files = []
+        if data_dir.is_dir():
+            with os.scandir(data_dir) as it:
+                pdf_files = [e for e in it if e.name.endswith(".pdf") and e.is_file()]
+            # Inode order (free from the directory listing) roughly follows the
+            # on-disk layout, keeping cold-cache reads of large corpora sequential
+            pdf_files.sort(key=lambda e: e.inode())
 
         if not pdf_files:
-            print("[X] Error: No PDF files found in ./data directory")
-            print()
-            print("Add financial PDF documents to the ./data directory")
-            print("Or specify documents with: --docs path/to/file.pdf")
+            log("[X] Error: No PDF files found in ./data directory")
+            log()
+            log("Add financial PDF documents to the ./data directory")
+            log("Or specify documents with: --docs path/to/file.pdf")
             sys.exit(1)
 
-        pdf_paths = [str(f) for f in pdf_files]
+        pdf_paths = [e.path for e in pdf_files]
 
     try:
         # Initialize system
-        system = OVRAGSystem(ontology_dir=args.ontology_dir)
+        system = OVRAGSystem(
+            ontology_dir=args.ontology_dir,
+            correction_variants=args.correction_variants,
+            cache_dir=args.cache_dir,
+            rpm=args.rpm,
+            tpm=args.tpm,
+            cache_answers=args.cache_answers,
+            extractor_model=args.extractor_model,
+            vector_store_dir=args.vector_store_dir,
+        )
 
         # Load documents
-        print()
+        log()
         num_chunks = system.load_documents(pdf_paths)
 
         if num_chunks == 0:
-            print("[X] No documents loaded")
+            log("[X] No documents loaded")
             sys.exit(1)
 
         # Single query mode
         if args.query:
-            system.process_query(args.query, validate=not args.no_validate)
+            if len(args.query) == 1:
+                system.process_query(args.query[0], validate=not args.no_validate)
+            else:
+                system.process_queries(
+                    args.query,
+                    validate=not args.no_validate,
+                    max_concurrency=args.concurrency,
+                )
             return
 
         # Interactive mode
         system.interactive_mode()
 
     except KeyboardInterrupt:
-        print("\n\nInterrupted. Goodbye!")
+        log("\n\nInterrupted. Goodbye!")
         sys.exit(0)
     except Exception as e:
-        print(f"\n[X] Fatal Error: {type(e).__name__}: {str(e)}")
+        log(f"\n[X] Fatal Error: {type(e).__name__}: {str(e)}")
         import traceback
+        flush_log()
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        stop_log()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,98 @@
+"""
+console.py
+Non-blocking progress output for the OV-RAG pipeline.
+
+Progress lines are handed to a background thread through a queue
+(logging.QueueHandler / QueueListener), so the query path never waits on
+a slow terminal between LLM calls. The thread is started by the first
+log() call, so merely importing this module starts no thread.
+
+When stdout has been redirected (contextlib.redirect_stdout in app.py and
+evaluation/evaluate.py, pytest capture), lines are written directly to
+the current sys.stdout instead, so callers capturing the log still see
+every line, in order, as soon as the call returns.
+
+Bulky diagnostic output (raw LLM responses, per-triple listings) goes
+through debug() or is guarded by is_verbose(), and stays silent unless
+verbose output was switched on with set_verbose() or the OVRAG_VERBOSE
+environment variable.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+
+_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_listener = None
+_listener_lock = threading.Lock()
+_running = True
+_verbose = os.getenv("OVRAG_VERBOSE", "") not in ("", "0")
+
+logger = logging.getLogger("ovrag")
+logger.addHandler(QueueHandler(_queue))
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+
+def _start_listener():
+    """Start the background writer thread (once)."""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = QueueListener(_queue, logging.StreamHandler(sys.__stdout__))
+            _listener.start()
+
+
+def log(message: str = ""):
+    """Write one line of progress output (drop-in for print)."""
+    if _running and sys.stdout is sys.__stdout__:
+        if _listener is None:
+            _start_listener()
+        logger.info(message)
+    else:
+        print(message)
+
+
+def debug(message: str, *args):
+    """
+    Write a diagnostic line, only in verbose mode.
+
+    Use %-style args so nothing is formatted when verbose output is off.
+    """
+    if _verbose:
+        log(message % args if args else message)
+
+
+def is_verbose() -> bool:
+    """True if debug() output is on (to skip building bulky messages)."""
+    return _verbose
+
+
+def set_verbose(enabled: bool = True):
+    """Switch debug() output on or off."""
+    global _verbose
+    _verbose = enabled
+
+
+def flush_log():
+    """Block until every queued line has been written (e.g. before input())."""
+    if _running and _listener is not None:
+        _queue.join()
+
+
+def stop_log():
+    """Write any queued lines and stop the background writer."""
+    global _running
+    if _running:
+        _running = False
+        with _listener_lock:
+            if _listener is not None:
+                _listener.stop()
+
+
+atexit.register(stop_log)
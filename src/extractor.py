@@ -14,26 +14,44 @@ FEATURE: Dynamisches Prompt-Loading aus vocabulary_cache.json
 
 import os
 import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 
 from openai import OpenAI
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # raises a json.JSONDecodeError subclass
+except ImportError:  # optional: stdlib json fallback
+    _json_loads = json.loads
+
+from console import debug, is_verbose, log, set_verbose
+from rate_limiter import RateLimiter, estimate_tokens
+
+
+# Vokabular-Cache (von vocabulary_scanner.py erzeugt)
+_VOCABULARY_CACHE = Path(__file__).resolve().parent.parent / "config" / "vocabulary_cache.json"
+
 
 # Versuche dynamischen Prompt aus Cache zu laden
 def _load_dynamic_prompt() -> Optional[str]:
     """Lädt den dynamisch generierten Prompt aus dem Vokabular-Cache."""
-    cache_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'config', 'vocabulary_cache.json')
-    if os.path.exists(cache_path):
-        try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            prompt = data.get('generated_prompt')
-            if prompt:
-                print(f"[OK] Dynamischer Prompt geladen aus {cache_path}")
-                return prompt
-        except Exception as e:
-            print(f"[!] Fehler beim Laden des Caches: {e}")
+    try:
+        prompt = _json_loads(_VOCABULARY_CACHE.read_bytes()).get('generated_prompt')
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log(f"[!] Fehler beim Laden des Caches: {e}")
+        return None
+    if prompt:
+        log(f"[OK] Dynamischer Prompt geladen aus {_VOCABULARY_CACHE}")
+        return prompt
     return None
 
 
@@ -130,10 +148,111 @@ If no triples can be extracted, return: {"triples": []}
 _DYNAMIC_PROMPT = _load_dynamic_prompt()
 EXTRACTION_SYSTEM_PROMPT = _DYNAMIC_PROMPT if _DYNAMIC_PROMPT else STATIC_EXTRACTION_PROMPT
 
+# Routing hint for OpenAI prompt caching: requests sharing a key (and the
+# same system prompt prefix) are sent to servers that have it cached
+PROMPT_CACHE_KEY = "ovrag-extractor-v1"
+
+# Extraction requests in flight at once in extract_triples_batch()
+DEFAULT_BATCH_CONCURRENCY = 8
+
+# Seconds between status checks of an offline (Batch API) job
+BATCH_POLL_INTERVAL = 30
+
+_BATCH_FINAL_STATES = ("completed", "failed", "expired", "cancelled")
+
+# Fields every extracted triple must carry as non-blank strings
+_TRIPLE_FIELDS = ("sub", "pred", "obj", "sub_type", "obj_type")
+
+# Structured output: the API constrains decoding to this shape, so
+# responses always parse and carry every field (blank strings are still
+# possible and are filtered by _validate_triple_structure)
+RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "triples",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "triples": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {field: {"type": "string"} for field in _TRIPLE_FIELDS},
+                        "required": list(_TRIPLE_FIELDS),
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["triples"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Fixed parameters of the answer and context extraction requests, built
+# once instead of per call (temperature 0: deterministic extraction)
+_ANSWER_REQUEST = {
+    "temperature": 0.0,
+    "response_format": RESPONSE_FORMAT,
+    "extra_body": {"prompt_cache_key": f"{PROMPT_CACHE_KEY}-answer"},
+}
+_CONTEXT_REQUEST = {
+    "temperature": 0.0,
+    "response_format": RESPONSE_FORMAT,
+    "extra_body": {"prompt_cache_key": f"{PROMPT_CACHE_KEY}-context"},
+}
+
+# Vocabulary fields of a triple: a handful of distinct values (predicates,
+# class names) repeated across every response
+_TERM_FIELDS = ("pred", "sub_type", "obj_type")
+
+
+def _intern_terms(triple: Dict) -> Dict:
+    """Intern the vocabulary fields of triple, so repeats share one string."""
+    for field in _TERM_FIELDS:
+        triple[field] = sys.intern(triple[field])
+    return triple
+
+
+# A truncated input is cut back to its last sentence end if that lies
+# within this fraction of the end
+_SENTENCE_BACKTRACK = 0.2
+
+
+# api_key -> OpenAI client, shared by every TripleExtractor in the process
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _client_for(api_key: str) -> OpenAI:
+    """
+    Shared OpenAI client for api_key.
+
+    Tests and scripts that build several extractors reuse one connection
+    pool instead of opening a new TLS connection per instance.
+    """
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(api_key)
+        if client is None:
+            # Bounded so a stalled request fails instead of hanging the query
+            client = _CLIENTS[api_key] = OpenAI(api_key=api_key, timeout=60, max_retries=3)
+    return client
+
 
-@dataclass
+@lru_cache(maxsize=None)
+def _encoding(model: str):
+    """tiktoken encoding for model (built once; construction is slow)."""
+    import tiktoken
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+@dataclass(slots=True)
 class ExtractionResult:
-    """Result of triple extraction."""
+    """Result of triple extraction (slotted: batches can hold thousands)."""
     triples: List[Dict]
     raw_response: str
     success: bool
@@ -153,13 +272,31 @@ class TripleExtractor:
     loan/financial statements into LOAN ontology-compliant RDF triples.
     """
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o"):
+    rate_limiter = None
+    # Persistent store for successful extractions (a result_cache.ResultCache);
+    # None disables caching
+    result_cache = None
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gpt-4o",
+        rate_limiter: Optional[RateLimiter] = None,
+        result_cache=None,
+        max_input_tokens: Optional[int] = None,
+    ):
         """
         Initialize the triple extractor.
 
         Args:
             api_key: OpenAI API key (or None to use env variable)
             model: OpenAI model to use for extraction
+            rate_limiter: Shared OpenAI rate limiter (None = unlimited)
+            result_cache: ResultCache for successful extractions, keyed by
+                model, system prompt and text (None = off)
+            max_input_tokens: Truncate longer inputs to about this many
+                tokens, at a sentence boundary where possible (None = send
+                everything; facts past the cap are then not extracted)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
@@ -169,11 +306,71 @@ class TripleExtractor:
             )
 
         self.model = model
-        self.client = OpenAI(api_key=self.api_key)
+        self._client = None
+        self.rate_limiter = rate_limiter
+        self.result_cache = result_cache
+        self.max_input_tokens = max_input_tokens
+        self._system_messages = {}
 
         # Zeige an, welcher Prompt verwendet wird
         prompt_type = "dynamisch (vocabulary_cache.json)" if _DYNAMIC_PROMPT else "statisch (Fallback)"
-        print(f"[OK] Triple Extractor initialized (model: {model}, prompt: {prompt_type})")
+        log(f"[OK] Triple Extractor initialized (model: {model}, prompt: {prompt_type})")
+
+    @property
+    def client(self) -> OpenAI:
+        """OpenAI client, created on first use (not needed by cache hits)."""
+        if self._client is None:
+            self._client = _client_for(self.api_key)
+        return self._client
+
+    def _system_message(self, prompt: str) -> Dict:
+        """
+        System message for prompt, built once per distinct prompt.
+
+        The prompt is passed in at call time (not captured in __init__) so
+        evaluation scripts that swap the module-level prompts still take
+        effect. Keeping it first lets the API reuse the cached prefix.
+        """
+        message = self._system_messages.get(prompt)
+        if message is None:
+            message = self._system_messages[prompt] = {"role": "system", "content": prompt}
+        return message
+
+    def _truncate(self, text: str) -> str:
+        """Cut text to max_input_tokens tokens, preferring a sentence end."""
+        limit = self.max_input_tokens
+        # Every token is at least one byte, so short texts need no encoding
+        if limit is None or len(text.encode("utf-8")) <= limit:
+            return text
+        encoding = _encoding(self.model)
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= limit:
+            return text
+
+        truncated = encoding.decode(tokens[:limit])
+        cut = max(truncated.rfind(". "), truncated.rfind("\n"))
+        if cut >= len(truncated) * (1 - _SENTENCE_BACKTRACK):
+            truncated = truncated[:cut + 1]
+        log(f"[!] Input truncated from {len(tokens)} to ~{limit} tokens")
+        return truncated
+
+    def _cache_key(self, kind: str, prompt: str, text: str) -> Optional[str]:
+        """result_cache key for an extraction, or None when caching is off."""
+        if self.result_cache is None:
+            return None
+        return self.result_cache.make_key(kind, self.model, prompt, text)
+
+    def _complete(self, messages: List[Dict], **kwargs):
+        """Chat completion with self.model, through the rate limiter if one is set."""
+        if self.rate_limiter is None:
+            return self.client.chat.completions.create(model=self.model, messages=messages, **kwargs)
+        return self.rate_limiter.call(
+            self.client.chat.completions.create,
+            model=self.model,
+            messages=messages,
+            tokens=estimate_tokens(*(m["content"] for m in messages)),
+            **kwargs,
+        )
 
     def extract_triples(self, text: str) -> ExtractionResult:
         """
@@ -185,35 +382,42 @@ class TripleExtractor:
         Returns:
             ExtractionResult with extracted triples
         """
-        print(f"\nExtracting triples from text...")
-        print(f"Text: {text[:100]}..." if len(text) > 100 else f"Text: {text}")
+        log(f"\nExtracting triples from text...")
+        log(f"Text: {text[:100]}..." if len(text) > 100 else f"Text: {text}")
+
+        text = self._truncate(text)
+        prompt = EXTRACTION_SYSTEM_PROMPT
+        key = self._cache_key("extract", prompt, text)
+        if key is not None:
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                log(f"[cache] {cached}")
+                return cached
 
         try:
             # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model=self.model,
+            response = self._complete(
                 messages=[
-                    {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+                    self._system_message(prompt),
                     {"role": "user", "content": text}
                 ],
-                temperature=0.0,  # Deterministic extraction
-                response_format={"type": "json_object"}  # Force JSON output
+                **_ANSWER_REQUEST
             )
 
             raw_response = response.choices[0].message.content
-            print(f"\nRaw extraction response:\n{raw_response}")
+            debug("\nRaw extraction response:\n%s", raw_response)
 
             # Parse JSON response
-            parsed = json.loads(raw_response)
+            parsed = _json_loads(raw_response)
             triples = parsed.get("triples", [])
 
             # Validate triple structure
             validated_triples = []
             for triple in triples:
                 if self._validate_triple_structure(triple):
-                    validated_triples.append(triple)
+                    validated_triples.append(_intern_terms(triple))
                 else:
-                    print(f"Warning: Invalid triple structure: {triple}")
+                    log(f"Warning: Invalid triple structure: {triple}")
 
             result = ExtractionResult(
                 triples=validated_triples,
@@ -221,14 +425,16 @@ class TripleExtractor:
                 success=True
             )
 
-            print(f"\n{result}")
-            if validated_triples:
-                print("\nExtracted triples:")
+            log(f"\n{result}")
+            if validated_triples and is_verbose():
+                log("\nExtracted triples:")
                 for i, triple in enumerate(validated_triples, 1):
-                    print(f"  {i}. {triple['sub']} ({triple['sub_type']}) "
+                    log(f"  {i}. {triple['sub']} ({triple['sub_type']}) "
                           f"{triple['pred']} "
                           f"{triple['obj']} ({triple['obj_type']})")
 
+            if key is not None:
+                self.result_cache.set(key, result)
             return result
 
         except json.JSONDecodeError as e:
@@ -247,6 +453,146 @@ class TripleExtractor:
                 error=f"Extraction error: {type(e).__name__}: {str(e)}"
             )
 
+    def extract_triples_batch(
+        self, texts: List[str], max_concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> List[ExtractionResult]:
+        """
+        Extract triples from several texts concurrently.
+
+        Each distinct text is handled by extract_triples() in a worker
+        thread, so up to max_concurrency requests wait on the API at once;
+        repeated texts share one result. RPM/TPM limits and 429 backoff are
+        handled by the rate limiter, if one is set.
+
+        Args:
+            texts: Texts to extract from
+            max_concurrency: Maximum requests in flight
+
+        Returns:
+            One ExtractionResult per text, in the same order
+        """
+        if not texts:
+            return []
+        unique = list(dict.fromkeys(texts))
+        with ThreadPoolExecutor(max_workers=min(len(unique), max_concurrency)) as pool:
+            by_text = dict(zip(unique, pool.map(self.extract_triples, unique)))
+        return [by_text[text] for text in texts]
+
+    def extract_triples_offline_batch(
+        self,
+        texts: List[str],
+        context: bool = False,
+        poll_interval: float = BATCH_POLL_INTERVAL,
+        timeout: Optional[float] = None
+    ) -> List[ExtractionResult]:
+        """
+        Extract triples from many texts with one OpenAI Batch API job.
+
+        For offline bulk work (e.g. extracting context triples for a whole
+        corpus): batch requests cost about half as much and do not count
+        against the interactive rate limits, but may take up to 24h. Blocks,
+        polling every poll_interval seconds, until the job finishes.
+        Repeated texts are submitted once and share one result.
+
+        Args:
+            texts: Texts to extract from
+            context: Use the context extraction prompt (extract_from_context)
+                instead of the answer prompt (extract_triples)
+            poll_interval: Seconds between status checks
+            timeout: Give up waiting after this many seconds (None = wait)
+
+        Returns:
+            One ExtractionResult per text, in the same order
+        """
+        if not texts:
+            return []
+
+        if context:
+            system_message = self._system_message(CONTEXT_EXTRACTION_PROMPT)
+            request = _CONTEXT_REQUEST
+        else:
+            system_message = self._system_message(EXTRACTION_SYSTEM_PROMPT)
+            request = _ANSWER_REQUEST
+
+        unique = list(dict.fromkeys(texts))
+        lines = [
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [system_message, {"role": "user", "content": self._truncate(text)}],
+                    "temperature": request["temperature"],
+                    "response_format": request["response_format"],
+                    **request["extra_body"],
+                },
+            })
+            for i, text in enumerate(unique)
+        ]
+        batch_file = self.client.files.create(
+            file=("extraction_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        log(f"\nSubmitted extraction batch {batch.id} ({len(unique)} unique text(s))")
+
+        started = time.monotonic()
+        while batch.status not in _BATCH_FINAL_STATES:
+            if timeout is not None and time.monotonic() - started > timeout:
+                raise TimeoutError(f"Batch {batch.id} still {batch.status} after {timeout}s")
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        results = [
+            ExtractionResult(triples=[], raw_response="", success=False,
+                             error=f"Batch {batch.id} {batch.status}: no result")
+            for _ in unique
+        ]
+        position = {text: i for i, text in enumerate(unique)}
+        if batch.status != "completed" or not batch.output_file_id:
+            log(f"[X] Extraction batch {batch.id} {batch.status}")
+            return [results[position[text]] for text in texts]
+
+        output = self.client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = _json_loads(line)
+            index = int(record["custom_id"])
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                error = record.get("error") or response.get("body", {}).get("error")
+                results[index] = ExtractionResult(
+                    triples=[], raw_response="", success=False,
+                    error=f"Batch request error: {error}"
+                )
+                continue
+
+            raw_response = response["body"]["choices"][0]["message"]["content"]
+            try:
+                triples = _json_loads(raw_response).get("triples", [])
+            except (json.JSONDecodeError, AttributeError) as e:
+                results[index] = ExtractionResult(
+                    triples=[], raw_response=raw_response, success=False,
+                    error=f"JSON parsing error: {e}"
+                )
+                continue
+            results[index] = ExtractionResult(
+                triples=[_intern_terms(t) for t in triples
+                         if self._validate_triple_structure(t)],
+                raw_response=raw_response,
+                success=True
+            )
+
+        succeeded = sum(r.success for r in results)
+        log(f"[OK] Extraction batch {batch.id}: {succeeded}/{len(unique)} succeeded")
+        return [results[position[text]] for text in texts]
+
     def _validate_triple_structure(self, triple: Dict) -> bool:
         """
         Validate that a triple has the required fields.
@@ -257,12 +603,12 @@ class TripleExtractor:
         Returns:
             bool: True if valid structure
         """
-        required_fields = ["sub", "pred", "obj", "sub_type", "obj_type"]
+        if not isinstance(triple, dict):
+            return False
 
-        for field in required_fields:
-            if field not in triple:
-                return False
-            if not isinstance(triple[field], str) or not triple[field].strip():
+        for field in _TRIPLE_FIELDS:
+            value = triple.get(field)
+            if not isinstance(value, str) or not value.strip():
                 return False
 
         return True
@@ -302,32 +648,39 @@ class TripleExtractor:
         Returns:
             ExtractionResult with context triples
         """
-        print(f"\nExtracting context triples from source documents...")
-        print(f"Context: {context_text[:100]}..." if len(context_text) > 100 else f"Context: {context_text}")
+        log(f"\nExtracting context triples from source documents...")
+        log(f"Context: {context_text[:100]}..." if len(context_text) > 100 else f"Context: {context_text}")
+
+        context_text = self._truncate(context_text)
+        prompt = CONTEXT_EXTRACTION_PROMPT
+        key = self._cache_key("context", prompt, context_text)
+        if key is not None:
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                log(f"[cache] [Context] {cached}")
+                return cached
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
+            response = self._complete(
                 messages=[
-                    {"role": "system", "content": CONTEXT_EXTRACTION_PROMPT},
+                    self._system_message(prompt),
                     {"role": "user", "content": context_text}
                 ],
-                temperature=0.0,
-                response_format={"type": "json_object"}
+                **_CONTEXT_REQUEST
             )
 
             raw_response = response.choices[0].message.content
-            print(f"\nRaw context extraction response:\n{raw_response}")
+            debug("\nRaw context extraction response:\n%s", raw_response)
 
-            parsed = json.loads(raw_response)
+            parsed = _json_loads(raw_response)
             triples = parsed.get("triples", [])
 
             validated_triples = []
             for triple in triples:
                 if self._validate_triple_structure(triple):
-                    validated_triples.append(triple)
+                    validated_triples.append(_intern_terms(triple))
                 else:
-                    print(f"Warning: Invalid context triple structure: {triple}")
+                    log(f"Warning: Invalid context triple structure: {triple}")
 
             result = ExtractionResult(
                 triples=validated_triples,
@@ -335,14 +688,16 @@ class TripleExtractor:
                 success=True
             )
 
-            print(f"\n[Context] {result}")
-            if validated_triples:
-                print("\nContext triples:")
+            log(f"\n[Context] {result}")
+            if validated_triples and is_verbose():
+                log("\nContext triples:")
                 for i, triple in enumerate(validated_triples, 1):
-                    print(f"  {i}. {triple['sub']} ({triple['sub_type']}) "
+                    log(f"  {i}. {triple['sub']} ({triple['sub_type']}) "
                           f"{triple['pred']} "
                           f"{triple['obj']} ({triple['obj_type']})")
 
+            if key is not None:
+                self.result_cache.set(key, result)
             return result
 
         except json.JSONDecodeError as e:
@@ -385,14 +740,15 @@ def extract_triples_from_text(
     if result.success:
         return result.triples
     else:
-        print(f"Extraction failed: {result.error}")
+        log(f"Extraction failed: {result.error}")
         return []
 
 
 if __name__ == "__main__":
     # Test the extractor with sample text
-    print("Testing Triple Extractor...")
-    print()
+    set_verbose()
+    log("Testing Triple Extractor...")
+    log()
 
     # Example 1: Valid financial statement
     test_text_1 = """
@@ -412,24 +768,24 @@ if __name__ == "__main__":
 
     # Check if API key is available
     if not os.getenv("OPENAI_API_KEY"):
-        print("WARNING: OPENAI_API_KEY not set. Set it to run the test:")
-        print("  export OPENAI_API_KEY='your-key-here'")
+        log("WARNING: OPENAI_API_KEY not set. Set it to run the test:")
+        log("  export OPENAI_API_KEY='your-key-here'")
         exit(1)
 
     extractor = TripleExtractor()
 
-    print("\n" + "="*70)
-    print("Test 1: Valid Financial Statement")
-    print("="*70)
+    log("\n" + "="*70)
+    log("Test 1: Valid Financial Statement")
+    log("="*70)
     result1 = extractor.extract_triples(test_text_1)
 
-    print("\n" + "="*70)
-    print("Test 2: Potentially Problematic Statement")
-    print("="*70)
+    log("\n" + "="*70)
+    log("Test 2: Potentially Problematic Statement")
+    log("="*70)
     result2 = extractor.extract_triples(test_text_2)
 
-    print("\n" + "="*70)
-    print("Summary")
-    print("="*70)
-    print(f"Test 1: {result1}")
-    print(f"Test 2: {result2}")
+    log("\n" + "="*70)
+    log("Summary")
+    log("="*70)
+    log(f"Test 1: {result1}")
+    log(f"Test 2: {result2}")
@@ -13,16 +13,35 @@ Pipeline:
 4. Generate Answer (Temperature=0.7 to encourage hallucinations for testing)
 """
 
+import asyncio
+import hashlib
+import json
+import multiprocessing
 import os
+import re
+import shutil
+import threading
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
+import chromadb
 from dotenv import load_dotenv
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
 from langchain_community.document_loaders import PyPDFLoader
 from langchain_community.vectorstores import Chroma
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.embeddings import Embeddings
+
+try:
+    import xxhash
+except ImportError:  # optional: blake2b fallback
+    xxhash = None
+
+from console import log
+from rate_limiter import RateLimiter, estimate_tokens
 
 
 # RAG Prompt Template
@@ -66,6 +85,261 @@ Instructions:
 Corrected answer:"""
 
 
+# Batch Prompt Template - answers several questions in one LLM call
+BATCH_PROMPT_TEMPLATE = """You are a financial analyst assistant. Answer each numbered question independently, using only the context given for that question.
+
+{blocks}
+
+Instructions:
+- Provide a clear, concise answer for every question based on its own context
+- If an answer is not in its context, say "I don't have enough information to answer this question."
+- Focus on factual information about entities, relationships, and ownership structures
+- Be specific about company names, ownership percentages, and corporate relationships
+
+Return ONLY a JSON array of {count} strings, where element i is the answer to question i+1.
+
+Answers:"""
+
+BATCH_BLOCK_TEMPLATE = """Question {number}: {question}
+Context for question {number}:
+{context}"""
+
+# Maximum number of questions marshaled into one batch prompt; beyond this
+# the longer prompt costs more latency than the saved round-trips
+MAX_BATCH_QUESTIONS = 8
+
+
+def _split_template(template: str, *fields: str) -> tuple:
+    """
+    Split a str.format template into the literal text around its fields.
+
+    fields must be listed in the order they appear, each exactly once.
+    Prompts are then built with "".join() instead of re-parsing the
+    template on every call.
+    """
+    fragments = []
+    rest = template
+    for name in fields:
+        head, rest = rest.split("{" + name + "}")
+        fragments.append(head)
+    fragments.append(rest)
+    return tuple(fragments)
+
+
+_RAG = _split_template(RAG_PROMPT_TEMPLATE, "context", "question")
+_CORRECTION = _split_template(
+    CORRECTION_PROMPT_TEMPLATE,
+    "context", "question", "attempt_number", "previous_answer", "validation_feedback",
+)
+
+
+def _rag_prompt(context: str, question: str) -> str:
+    """RAG_PROMPT_TEMPLATE.format(context=..., question=...)"""
+    return "".join((_RAG[0], context, _RAG[1], question, _RAG[2]))
+
+
+def _correction_prompt(
+    context: str, question: str, attempt_number: int,
+    previous_answer: str, validation_feedback: str,
+) -> str:
+    """CORRECTION_PROMPT_TEMPLATE.format(...) with the same fields."""
+    return "".join((
+        _CORRECTION[0], context, _CORRECTION[1], question,
+        _CORRECTION[2], str(attempt_number), _CORRECTION[3], previous_answer,
+        _CORRECTION[4], validation_feedback, _CORRECTION[5],
+    ))
+
+
+# Bounds on OpenAI calls so a stalled request fails instead of hanging
+REQUEST_TIMEOUT = 30  # seconds per attempt
+LLM_MAX_RETRIES = 3
+EMBEDDING_MAX_RETRIES = 5
+MAX_ANSWER_TOKENS = 512  # per answer (batch prompts get this per question)
+
+# Below this many PDFs, parsing in-process is cheaper than starting workers
+PARALLEL_LOAD_MIN_FILES = 8
+
+# Chunks are embedded in batches of at least this many (small files are
+# pooled), so a corpus of many short PDFs still needs few API requests
+EMBED_BATCH_SIZE = 256
+
+# ...unless the batch reaches this many (estimated) tokens first, which
+# keeps single requests well below the per-request and TPM limits
+EMBED_BATCH_MAX_TOKENS = 100_000
+
+# Batches that may wait for embedding while the next files are parsed
+# (bounds memory when parsing outpaces the embedding API)
+EMBED_PREFETCH = 2
+
+# Embeddings remembered by content hash (boilerplate repeated across
+# documents is embedded once)
+EMBED_MEMO_SIZE = 4096
+
+# Marker written into a persistent vector store once all chunks are in;
+# holds the chunk count
+_STORE_COMPLETE = "complete.txt"
+
+# Retrieval results kept for repeated questions (per loaded corpus)
+RETRIEVAL_CACHE_SIZE = 128
+
+# HNSW index settings for new collections. Chroma's default search_ef of
+# 10 leaves little headroom over top_k; 40 keeps recall near exact search
+# on corpora of this size at negligible query cost. Distance stays L2:
+# OpenAI embeddings are unit length, so it ranks like cosine.
+HNSW_METADATA = {
+    "hnsw:M": 16,
+    "hnsw:construction_ef": 100,
+    "hnsw:search_ef": 40,
+}
+
+_WS_RE = re.compile(r"\s+")
+
+
+def _normalize_question(question: str) -> str:
+    """Case/whitespace/trailing-punctuation-insensitive form of a question."""
+    return _WS_RE.sub(" ", question).strip().rstrip("?!. ").lower()
+
+
+@lru_cache(maxsize=1)
+def _cl100k():
+    import tiktoken
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def _token_len(text: str) -> int:
+    """Length in cl100k_base tokens (the encoding of the OpenAI embedding models).
+
+    Module-level so a splitter using it can be sent to worker processes.
+    """
+    return len(_cl100k().encode(text, disallowed_special=()))
+
+
+def format_context(sources: list) -> str:
+    """Join retrieved chunks into the context block used by all prompts."""
+    return "\n\n".join([doc.page_content for doc in sources])
+
+
+def _load_and_split(pdf_path: str, splitter) -> Tuple[list, Optional[str]]:
+    """
+    Parse one PDF and split it into chunks (may run in a worker process).
+
+    Returns:
+        (chunks, error) - error is None on success
+    """
+    try:
+        documents = PyPDFLoader(pdf_path).load()
+        return splitter.split_documents(documents), None
+    except Exception as e:
+        return [], str(e)
+
+
+class _DedupEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that sends each distinct text to the API once.
+
+    Identical chunks (repeated headers, footers, boilerplate clauses) within
+    a batch and across recent batches reuse one vector. Questions share the
+    same memo, so a question asked again after the retrieval cache was
+    cleared (e.g. by loading new documents) is not re-embedded.
+    """
+
+    def __init__(self, base: Embeddings, memo_size: int = EMBED_MEMO_SIZE):
+        self.base = base
+        self.memo_size = memo_size
+        self._memo = OrderedDict()
+        self._lock = threading.Lock()
+        self.deduplicated = 0
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        # Memo keys never leave the process, so the faster non-cryptographic
+        # hash is fine when available
+        if xxhash is not None:
+            return xxhash.xxh3_128_digest(text)
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._key(t) for t in texts]
+        found = {}
+        missing = {}
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in found or key in missing:
+                    continue
+                vector = self._memo.get(key)
+                if vector is None:
+                    missing[key] = text
+                else:
+                    self._memo.move_to_end(key)
+                    found[key] = vector
+            self.deduplicated += len(texts) - len(missing)
+
+        if missing:
+            vectors = self.base.embed_documents(list(missing.values()))
+            found.update(zip(missing, vectors))
+            with self._lock:
+                self._memo.update(zip(missing, vectors))
+                while len(self._memo) > self.memo_size:
+                    self._memo.popitem(last=False)
+
+        return [found[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        key = self._key(text)
+        with self._lock:
+            vector = self._memo.get(key)
+            if vector is not None:
+                self._memo.move_to_end(key)
+                self.deduplicated += 1
+                return vector
+
+        vector = self.base.embed_query(text)
+        with self._lock:
+            self._memo[key] = vector
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return vector
+
+
+# (api_key, model, temperature, embedding_model, embedding_dimensions)
+#   -> (embeddings, llm), shared by every RAGPipeline in the process
+_CLIENT_CACHE = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+def _clients(api_key: str, model: str, temperature: float, embedding_model: str,
+             embedding_dimensions: Optional[int]) -> Tuple["_DedupEmbeddings", ChatOpenAI]:
+    """
+    Return the embeddings and chat clients for a pipeline configuration.
+
+    Scripts that build a fresh RAGPipeline per test case (evaluation, the
+    Streamlit app) reuse the clients, their HTTP connection pools and the
+    embedding memo instead of constructing them again.
+    """
+    key = (api_key, model, temperature, embedding_model, embedding_dimensions)
+    with _CLIENT_LOCK:
+        clients = _CLIENT_CACHE.get(key)
+        if clients is None:
+            # text-embedding-3 vectors can be truncated server-side with little
+            # loss; smaller vectors shrink the index and speed up search
+            embedding_kwargs = {"dimensions": embedding_dimensions} if embedding_dimensions else {}
+            embeddings = _DedupEmbeddings(OpenAIEmbeddings(
+                model=embedding_model,
+                request_timeout=REQUEST_TIMEOUT,
+                max_retries=EMBEDDING_MAX_RETRIES,
+                **embedding_kwargs
+            ))
+            llm = ChatOpenAI(
+                model=model,
+                temperature=temperature,
+                request_timeout=REQUEST_TIMEOUT,
+                max_retries=LLM_MAX_RETRIES,
+                max_tokens=MAX_ANSWER_TOKENS
+            )
+            clients = _CLIENT_CACHE[key] = (embeddings, llm)
+    return clients
+
+
 class RAGPipeline:
     """
     Simple RAG pipeline for financial document Q&A.
@@ -75,6 +349,12 @@ class RAGPipeline:
     ontology validator will detect.
     """
 
+    rate_limiter = None
+    persist_dir = None
+    # Persistent store for generated answers (a result_cache.ResultCache);
+    # None disables answer caching
+    answer_cache = None
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -83,7 +363,12 @@ class RAGPipeline:
         temperature: float = 0.7,  # Higher temp to encourage hallucinations
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
-        top_k: int = 3
+        top_k: int = 3,
+        rate_limiter: Optional[RateLimiter] = None,
+        embedding_dimensions: Optional[int] = None,
+        persist_dir: Optional[str] = None,
+        chunk_unit: str = "chars",
+        answer_cache=None
     ):
         """
         Initialize the RAG pipeline.
@@ -93,9 +378,20 @@ class RAGPipeline:
             model: LLM model for generation
             embedding_model: Model for embeddings
             temperature: Generation temperature (0.7 for testing hallucinations)
-            chunk_size: Size of text chunks
-            chunk_overlap: Overlap between chunks
+            chunk_size: Size of text chunks (in chunk_unit)
+            chunk_overlap: Overlap between chunks (in chunk_unit)
             top_k: Number of chunks to retrieve
+            rate_limiter: Shared OpenAI rate limiter (None = unlimited)
+            embedding_dimensions: Shorten embeddings to this many dimensions
+                (text-embedding-3 models only; None = full size)
+            persist_dir: Directory for persistent vector stores, one per
+                document set and embedding setup (None = in-memory only)
+            chunk_unit: "chars" or "tokens" (cl100k_base, as counted by the
+                embedding model) for chunk_size/chunk_overlap
+            answer_cache: ResultCache for LLM answers, keyed by model,
+                temperature and prompt text (None = off). Identical prompts
+                are then answered once, which also removes sampling
+                variation at non-zero temperature.
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
@@ -108,32 +404,42 @@ class RAGPipeline:
         self.temperature = temperature
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        if chunk_unit not in ("chars", "tokens"):
+            raise ValueError(f"chunk_unit must be 'chars' or 'tokens', not {chunk_unit!r}")
+        self.chunk_unit = chunk_unit
         self.top_k = top_k
+        self.rate_limiter = rate_limiter
+        self.answer_cache = answer_cache
+        self.embedding_model = embedding_model
+        self.embedding_dimensions = embedding_dimensions
+        self.persist_dir = Path(persist_dir) if persist_dir else None
 
         # Initialize components
         # API key will be read from environment (OPENAI_API_KEY)
-        self.embeddings = OpenAIEmbeddings(
-            model=embedding_model
-        )
-
-        self.llm = ChatOpenAI(
-            model=model,
-            temperature=temperature
+        self.embeddings, self.llm = _clients(
+            self.api_key, model, temperature, embedding_model, embedding_dimensions
         )
 
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
-            length_function=len
+            length_function=_token_len if chunk_unit == "tokens" else len
         )
 
         self.vectorstore = None
         self.retriever = None
 
-        print(f"[OK] RAG Pipeline initialized")
-        print(f"  Model: {model}")
-        print(f"  Temperature: {temperature} (encourages creative/hallucinated responses)")
-        print(f"  Top-k: {top_k}")
+        # Repeated questions (interactive mode re-asks, benchmark question
+        # sets) reuse their retrieved chunks instead of re-embedding the
+        # question and searching again
+        self._retrieval_cache = OrderedDict()
+        self._retrieval_lock = threading.Lock()
+        self.stats = Counter()
+
+        log(f"[OK] RAG Pipeline initialized")
+        log(f"  Model: {model}")
+        log(f"  Temperature: {temperature} (encourages creative/hallucinated responses)")
+        log(f"  Top-k: {top_k}")
 
     def load_documents(self, pdf_paths: List[str]) -> int:
         """
@@ -145,49 +451,206 @@ class RAGPipeline:
         Returns:
             Number of chunks created
         """
-        print(f"\nLoading {len(pdf_paths)} document(s)...")
-
-        all_chunks = []
+        log(f"\nLoading {len(pdf_paths)} document(s)...")
 
+        paths = []
         for pdf_path in pdf_paths:
             path = Path(pdf_path)
             if not path.exists():
-                print(f"[X] File not found: {pdf_path}")
+                log(f"[X] File not found: {pdf_path}")
                 continue
+            paths.append(path)
+
+        # The same documents embedded the same way earlier: reuse that store
+        store_dir = self._store_dir(paths)
+        if store_dir is not None:
+            marker = store_dir / _STORE_COMPLETE
+            if marker.exists():
+                total = int(marker.read_text())
+                self._use_vectorstore(self._new_vectorstore(store_dir))
+                log(f"[OK] Reusing vector store with {total} chunk(s) from {store_dir}")
+                return total
+            # Left over from an interrupted or failed load
+            shutil.rmtree(store_dir, ignore_errors=True)
+
+        # PDF parsing is CPU-bound pure Python, so larger batches are parsed
+        # in worker processes; map() keeps the input order and yields each
+        # file as soon as it is ready
+        args = ([str(p) for p in paths], [self.text_splitter] * len(paths))
+        pool = None
+        if len(paths) >= PARALLEL_LOAD_MIN_FILES:
+            workers = min(len(paths), os.cpu_count() or 1)
+            # A few tasks per worker keeps them balanced while sending the
+            # splitter and paths over in fewer round-trips
+            chunksize = max(1, len(paths) // (workers * 4))
+            # spawn, not fork: the console writer and validator warm-up
+            # threads may be running, and forking a threaded process can
+            # deadlock the child
+            pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            loaded = pool.map(_load_and_split, *args, chunksize=chunksize)
+        else:
+            loaded = map(_load_and_split, *args)
+
+        failed = False
+
+        def _parsed():
+            nonlocal failed
+            for path, (chunks, error) in zip(paths, loaded):
+                log(f"  Processing: {path.name}")
+                if error is not None:
+                    log(f"    [X] Error loading {path.name}: {error}")
+                    failed = True
+                    continue
+                log(f"    [OK] Created {len(chunks)} chunk(s)")
+                yield chunks
+
+        try:
+            vectorstore, total = self._embed_chunks(_parsed(), store_dir)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        if vectorstore is None:
+            log("[X] No documents loaded")
+            return 0
 
-            print(f"  Processing: {path.name}")
-
-            try:
-                # Load PDF
-                loader = PyPDFLoader(str(path))
-                documents = loader.load()
+        self._use_vectorstore(vectorstore)
+        # Only a complete load may be reused; a file that failed to parse
+        # is retried next time
+        if store_dir is not None and not failed:
+            store_dir.mkdir(parents=True, exist_ok=True)
+            (store_dir / _STORE_COMPLETE).write_text(str(total))
+        log(f"[OK] Vector store ready with {total} chunk(s)")
+        return total
 
-                # Split into chunks
-                chunks = self.text_splitter.split_documents(documents)
-                all_chunks.extend(chunks)
+    def load_chunks(self, chunks: list) -> int:
+        """
+        Embed already split documents into a new vector store.
 
-                print(f"    [OK] Created {len(chunks)} chunk(s)")
+        The embedding half of load_documents(), for callers that parse and
+        split documents themselves. The store is in-memory: without the
+        source files there is nothing to key a persistent store on.
 
-            except Exception as e:
-                print(f"    [X] Error loading {path.name}: {e}")
+        Args:
+            chunks: LangChain Documents (e.g. from _load_and_split)
 
-        if not all_chunks:
-            print("[X] No documents loaded")
+        Returns:
+            Number of chunks stored
+        """
+        log(f"\nCreating vector store with {len(chunks)} chunk(s)...")
+        vectorstore, total = self._embed_chunks([chunks])
+        if vectorstore is None:
+            log("[X] No chunks to load")
             return 0
 
-        # Create vector store
-        print(f"\nCreating vector store with {len(all_chunks)} chunk(s)...")
-        self.vectorstore = Chroma.from_documents(
-            documents=all_chunks,
-            embedding=self.embeddings,
-            collection_name="financial_docs"
+        self._use_vectorstore(vectorstore)
+        log(f"[OK] Vector store ready with {total} chunk(s)")
+        return total
+
+    def _embed_chunks(self, chunk_lists, store_dir: Optional[Path] = None) -> Tuple[object, int]:
+        """
+        Embed an iterable of chunk lists into a new vector store.
+
+        Embedding is network-bound: batches of EMBED_BATCH_SIZE chunks are
+        embedded in a background thread while the next list is produced
+        (for load_documents(), while the next files are parsed). At most
+        EMBED_PREFETCH batches wait for embedding, bounding memory.
+
+        Returns:
+            (vectorstore, number of chunks); the store is None if every
+            list was empty
+        """
+        vectorstore = None
+        total = 0
+        batch = []
+        batch_tokens = 0
+        pending = deque()
+        embedder = ThreadPoolExecutor(max_workers=1)
+
+        def _submit(chunks, tokens):
+            pending.append(embedder.submit(self._embed, vectorstore, chunks, tokens))
+            while len(pending) > EMBED_PREFETCH:
+                pending.popleft().result()
+
+        try:
+            for chunks in chunk_lists:
+                if not chunks:
+                    continue
+                if vectorstore is None:
+                    vectorstore = self._new_vectorstore(store_dir)
+                total += len(chunks)
+                for chunk in chunks:
+                    tokens = estimate_tokens(chunk.page_content, completion=0)
+                    if batch and batch_tokens + tokens > EMBED_BATCH_MAX_TOKENS:
+                        _submit(batch, batch_tokens)
+                        batch, batch_tokens = [], 0
+                    batch.append(chunk)
+                    batch_tokens += tokens
+                if len(batch) >= EMBED_BATCH_SIZE:
+                    _submit(batch, batch_tokens)
+                    batch, batch_tokens = [], 0
+            if batch:
+                _submit(batch, batch_tokens)
+            while pending:
+                pending.popleft().result()
+        finally:
+            embedder.shutdown(cancel_futures=True)
+        return vectorstore, total
+
+    def _embed(self, vectorstore, chunks: list, tokens: int):
+        """Embed chunks into vectorstore, through the rate limiter if one is set."""
+        if self.rate_limiter is None:
+            vectorstore.add_documents(chunks)
+        else:
+            self.rate_limiter.call(vectorstore.add_documents, chunks, tokens=tokens)
+
+    def _store_dir(self, paths: List[Path]) -> Optional[Path]:
+        """
+        Persistent store directory for a document set, or None if disabled.
+
+        Keyed on every file's path, size and mtime plus the chunking,
+        embedding and index settings, so changing any of them starts a new
+        store.
+        """
+        if self.persist_dir is None or not paths:
+            return None
+        key_parts = []
+        for path in sorted(paths):
+            st = path.stat()
+            key_parts.append((str(path.resolve()), st.st_size, st.st_mtime_ns))
+        key_parts.append((self.chunk_size, self.chunk_overlap, self.chunk_unit,
+                          self.embedding_model, self.embedding_dimensions,
+                          sorted(HNSW_METADATA.items())))
+        key = hashlib.sha1(repr(key_parts).encode("utf-8")).hexdigest()[:12]
+        return self.persist_dir / key
+
+    def _new_vectorstore(self, store_dir: Optional[Path] = None):
+        """
+        Vector store for load_documents()/load_chunks() to fill.
+
+        In-memory unless store_dir is given, in which case it is opened
+        (or created) on disk there.
+        """
+        if store_dir is None:
+            return Chroma(
+                collection_name="financial_docs",
+                embedding_function=self.embeddings,
+                collection_metadata=HNSW_METADATA
+            )
+        return Chroma(
+            client=chromadb.PersistentClient(path=str(store_dir)),
+            collection_name="financial_docs",
+            embedding_function=self.embeddings,
+            collection_metadata=HNSW_METADATA
         )
 
-        # Create retriever
+    def _use_vectorstore(self, vectorstore):
+        """Make vectorstore the one queries retrieve from."""
+        self.vectorstore = vectorstore
         self.retriever = self.vectorstore.as_retriever(search_kwargs={"k": self.top_k})
-
-        print(f"[OK] Vector store ready with {len(all_chunks)} chunk(s)")
-        return len(all_chunks)
+        self._retrieval_cache.clear()
 
     def query(self, question: str) -> dict:
         """
@@ -199,41 +662,300 @@ class RAGPipeline:
         Returns:
             Dict with 'answer' and 'source_documents'
         """
+        sources = self.retrieve(question)
+        answer = self.generate(question, sources)
+
+        return {
+            "answer": answer,
+            "source_documents": sources,
+            "question": question
+        }
+
+    def query_stream(self, question: str) -> Iterator[str]:
+        """
+        Streaming variant of query(): retrieve, then yield the answer text
+        piece by piece (see generate_stream()).
+
+        Args:
+            question: User question
+
+        Yields:
+            Pieces of the answer text
+        """
+        sources = self.retrieve(question)
+        yield from self.generate_stream(question, sources)
+
+    def retrieve(self, question: str) -> list:
+        """
+        Retrieve the top-k chunks for a question (first half of query()).
+
+        Args:
+            question: User question
+
+        Returns:
+            List of source documents
+        """
         if not self.retriever:
             raise RuntimeError("No documents loaded. Call load_documents() first.")
 
-        print(f"\nQuery: {question}")
-        print("Retrieving relevant context...")
+        log(f"\nQuery: {question}")
+        log("Retrieving relevant context...")
 
         # Retrieve relevant documents
-        sources = self.retriever.invoke(question)
+        sources = self._retrieve(question)
 
-        print(f"\nRetrieved {len(sources)} chunk(s)")
+        log(f"\nRetrieved {len(sources)} chunk(s)")
+        return sources
+
+    def generate(self, question: str, sources: list, context: Optional[str] = None) -> str:
+        """
+        Generate an answer from retrieved chunks (second half of query()).
+
+        Args:
+            question: User question
+            sources: Documents returned by retrieve()
+            context: format_context(sources), if the caller already built it
 
+        Returns:
+            Answer text
+        """
         # Format context from retrieved documents
-        context = "\n\n".join([doc.page_content for doc in sources])
+        if context is None:
+            context = format_context(sources)
 
         # Create prompt with context
-        prompt_text = RAG_PROMPT_TEMPLATE.format(context=context, question=question)
+        prompt_text = _rag_prompt(context, question)
 
         # Generate answer
-        answer = self.llm.invoke(prompt_text).content
+        answer = self._invoke(self.llm, prompt_text)
+
+        log(f"\nAnswer:\n{answer}")
+        return answer
+
+    def generate_stream(self, question: str, sources: list,
+                        context: Optional[str] = None) -> Iterator[str]:
+        """
+        Streaming variant of generate(): yield the answer as it is produced.
 
-        print(f"\nAnswer:\n{answer}")
+        Lets interactive callers show the first tokens instead of waiting
+        for the whole completion. Joining the yielded pieces gives the same
+        text generate() would return.
 
+        Args:
+            question: User question
+            sources: Documents returned by retrieve()
+            context: format_context(sources), if the caller already built it
+
+        Yields:
+            Pieces of the answer text
+        """
+        if context is None:
+            context = format_context(sources)
+        prompt_text = _rag_prompt(context, question)
+
+        key = self._answer_key(prompt_text)
+        cached = self.answer_cache.get(key) if key is not None else None
+        if cached is not None:
+            yield cached
+            return
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(estimate_tokens(prompt_text))
+        parts = []
+        for chunk in self.llm.stream(prompt_text):
+            if chunk.content:
+                parts.append(chunk.content)
+                yield chunk.content
+        answer = "".join(parts)
+
+        if key is not None:
+            self.answer_cache.set(key, answer)
+        log(f"\nAnswer:\n{answer}")
+
+    def generate_batch(self, questions: List[str], sources_list: List[list]) -> List[Optional[str]]:
+        """
+        Answer several questions with a single LLM call.
+
+        Each question is sent with its own retrieved chunks; the model
+        returns a JSON array of answers. Callers should chunk questions
+        into groups of at most MAX_BATCH_QUESTIONS.
+
+        Args:
+            questions: User questions
+            sources_list: Documents returned by retrieve(), one list per question
+
+        Returns:
+            One answer per question, or None for every entry if the
+            response could not be parsed (fall back to generate())
+        """
+        blocks = "\n\n".join(
+            BATCH_BLOCK_TEMPLATE.format(
+                number=i + 1,
+                question=question,
+                context=format_context(sources),
+            )
+            for i, (question, sources) in enumerate(zip(questions, sources_list))
+        )
+        prompt_text = BATCH_PROMPT_TEMPLATE.format(blocks=blocks, count=len(questions))
+
+        llm = self.llm.bind(max_tokens=MAX_ANSWER_TOKENS * len(questions))
+        content = self._invoke(llm, prompt_text).strip()
+
+        # Strip markdown code fences if present
+        if content.startswith("```"):
+            content = content.split("\n", 1)[-1].rsplit("```", 1)[0]
+
+        try:
+            answers = json.loads(content)
+        except json.JSONDecodeError:
+            answers = None
+        if not isinstance(answers, list) or len(answers) != len(questions):
+            log("  [!] Batch response could not be parsed")
+            return [None] * len(questions)
+
+        return [str(a) if a is not None else None for a in answers]
+
+    def _invoke(self, llm, prompt_text: str, temperature: Optional[float] = None) -> str:
+        """
+        Send prompt_text to llm, through the rate limiter if one is set.
+
+        With an answer_cache, a prompt already answered by the same model at
+        the same temperature (None = the pipeline default) is served from
+        the cache instead.
+        """
+        key = self._answer_key(prompt_text, temperature)
+        if key is not None:
+            cached = self.answer_cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self.rate_limiter is None:
+            content = llm.invoke(prompt_text).content
+        else:
+            content = self.rate_limiter.call(
+                llm.invoke, prompt_text, tokens=estimate_tokens(prompt_text)
+            ).content
+
+        if key is not None:
+            self.answer_cache.set(key, content)
+        return content
+
+    async def _ainvoke(self, llm, prompt_text: str, temperature: Optional[float] = None) -> str:
+        """Async variant of _invoke(), with the same cache and rate limiting."""
+        key = self._answer_key(prompt_text, temperature)
+        if key is not None:
+            cached = self.answer_cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self.rate_limiter is None:
+            content = (await llm.ainvoke(prompt_text)).content
+        else:
+            content = (await self.rate_limiter.acall(
+                llm.ainvoke, prompt_text, tokens=estimate_tokens(prompt_text)
+            )).content
+
+        if key is not None:
+            self.answer_cache.set(key, content)
+        return content
+
+    def _answer_key(self, prompt_text: str, temperature: Optional[float] = None) -> Optional[str]:
+        """answer_cache key for prompt_text, or None when caching is off."""
+        if self.answer_cache is None:
+            return None
+        if temperature is None:
+            temperature = self.temperature
+        return self.answer_cache.make_key(
+            "answer", self.model, repr(float(temperature)), prompt_text
+        )
+
+    def _retrieve(self, question: str) -> list:
+        """Retrieve chunks for question, reusing results for repeated questions."""
+        key = _normalize_question(question)
+        sources = self._cached_sources(key)
+        if sources is None:
+            sources = self.retriever.invoke(question)
+            self._store_sources(key, sources)
+        return sources
+
+    def _cached_sources(self, key: str) -> Optional[list]:
+        """Retrieval cache lookup (counts the query); None on a miss."""
+        with self._retrieval_lock:
+            self.stats["queries"] += 1
+            sources = self._retrieval_cache.get(key)
+            if sources is None:
+                return None
+            self._retrieval_cache.move_to_end(key)
+            self.stats["retrieval_hits"] += 1
+            return list(sources)
+
+    def _store_sources(self, key: str, sources: list):
+        """Remember retrieved chunks, evicting the least recently used entry."""
+        with self._retrieval_lock:
+            self._retrieval_cache[key] = list(sources)
+            if len(self._retrieval_cache) > RETRIEVAL_CACHE_SIZE:
+                self._retrieval_cache.popitem(last=False)
+
+    async def aquery(self, question: str) -> dict:
+        """
+        Async variant of query().
+
+        Awaits the retriever (question embedding) and the LLM instead of
+        blocking, so many questions can wait on OpenAI at the same time.
+
+        Args:
+            question: User question
+
+        Returns:
+            Dict with 'answer' and 'source_documents'
+        """
+        if not self.retriever:
+            raise RuntimeError("No documents loaded. Call load_documents() first.")
+
+        key = _normalize_question(question)
+        sources = self._cached_sources(key)
+        if sources is None:
+            sources = await self.retriever.ainvoke(question)
+            self._store_sources(key, sources)
+
+        prompt_text = _rag_prompt(format_context(sources), question)
+        answer = await self._ainvoke(self.llm, prompt_text)
+
+        log(f"\nQuery: {question}\nAnswer:\n{answer}")
         return {
             "answer": answer,
             "source_documents": sources,
             "question": question
         }
 
+    async def abatch_query(self, questions: List[str], concurrency: int = 8) -> List[dict]:
+        """
+        Run aquery() for several questions, at most `concurrency` at a time.
+
+        Returns:
+            Results in the same order as questions
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(question: str) -> dict:
+            async with semaphore:
+                return await self.aquery(question)
+
+        return await asyncio.gather(*(_one(q) for q in questions))
+
+    def batch_query(self, questions: List[str], concurrency: int = 8) -> List[dict]:
+        """Synchronous wrapper around abatch_query()."""
+        return asyncio.run(self.abatch_query(questions, concurrency))
+
     def query_with_correction(
         self,
         question: str,
         previous_answer: str,
         validation_feedback: str,
         attempt_number: int,
-        source_documents: list
+        source_documents: list,
+        temperature: Optional[float] = None,
+        context: Optional[str] = None
     ) -> dict:
         """
         Re-generate an answer incorporating ontology validation feedback.
@@ -247,26 +969,31 @@ class RAGPipeline:
             validation_feedback: Explanation from the ontology validator
             attempt_number: Current correction attempt (1-based)
             source_documents: Source docs from the original retrieval
+            temperature: Override the pipeline temperature for this call
+            context: format_context(source_documents), if the caller already
+                built it (saves re-joining the chunks on every attempt)
 
         Returns:
             Dict with 'answer' and 'source_documents'
         """
-        print(f"\nCorrection attempt {attempt_number}...")
+        log(f"\nCorrection attempt {attempt_number}...")
 
         # Reuse the same context from original retrieval
-        context = "\n\n".join([doc.page_content for doc in source_documents])
+        if context is None:
+            context = format_context(source_documents)
 
-        prompt_text = CORRECTION_PROMPT_TEMPLATE.format(
+        prompt_text = _correction_prompt(
             context=context,
             question=question,
+            attempt_number=attempt_number,
             previous_answer=previous_answer,
-            validation_feedback=validation_feedback,
-            attempt_number=attempt_number
+            validation_feedback=validation_feedback
         )
 
-        answer = self.llm.invoke(prompt_text).content
+        llm = self.llm if temperature is None else self.llm.bind(temperature=temperature)
+        answer = self._invoke(llm, prompt_text, temperature=temperature)
 
-        print(f"\nCorrected Answer:\n{answer}")
+        log(f"\nCorrected Answer:\n{answer}")
 
         return {
             "answer": answer,
@@ -313,13 +1040,13 @@ if __name__ == "__main__":
     load_dotenv()
 
     # Test the RAG pipeline
-    print("Testing RAG Pipeline...")
-    print()
+    log("Testing RAG Pipeline...")
+    log()
 
     # Check if API key is available
     if not os.getenv("OPENAI_API_KEY"):
-        print("WARNING: OPENAI_API_KEY not set. Set it to run the test:")
-        print("  export OPENAI_API_KEY='your-key-here'")
+        log("WARNING: OPENAI_API_KEY not set. Set it to run the test:")
+        log("  export OPENAI_API_KEY='your-key-here'")
         exit(1)
 
     # Check for test documents
@@ -327,10 +1054,10 @@ if __name__ == "__main__":
     pdf_files = list(data_dir.glob("*.pdf"))
 
     if not pdf_files:
-        print("WARNING: No PDF files found in ./data directory")
-        print("  Add some financial PDF documents to test the pipeline")
-        print()
-        print("Creating a sample text file for basic testing...")
+        log("WARNING: No PDF files found in ./data directory")
+        log("  Add some financial PDF documents to test the pipeline")
+        log()
+        log("Creating a sample text file for basic testing...")
 
         # Create a sample text document
         sample_text = """
@@ -357,13 +1084,13 @@ if __name__ == "__main__":
         sample_file = data_dir / "sample_financial_report.txt"
         data_dir.mkdir(exist_ok=True)
         sample_file.write_text(sample_text)
-        print(f"  Created: {sample_file}")
-        print()
-        print("Note: This is a text file. For full testing, add PDF documents.")
+        log(f"  Created: {sample_file}")
+        log()
+        log("Note: This is a text file. For full testing, add PDF documents.")
         exit(0)
 
-    print(f"Found {len(pdf_files)} PDF file(s) in ./data")
-    print()
+    log(f"Found {len(pdf_files)} PDF file(s) in ./data")
+    log()
 
     # Initialize pipeline
     pipeline = RAGPipeline()
@@ -376,11 +1103,11 @@ if __name__ == "__main__":
         "What is the relationship between ACME Corporation and TechStart Inc.?"
     ]
 
-    print("\n" + "="*70)
-    print("Testing Queries")
-    print("="*70)
+    log("\n" + "="*70)
+    log("Testing Queries")
+    log("="*70)
 
     for query in test_queries:
-        print("\n" + "-"*70)
+        log("\n" + "-"*70)
         result = pipeline.query(query)
-        print("-"*70)
+        log("-"*70)
@@ -0,0 +1,120 @@
+"""
+rate_limiter.py
+Client-side rate limiting for OpenAI calls.
+
+Concurrent queries, batch mode and parallel correction variants can push
+the pipeline past the account's requests-per-minute (RPM) and
+tokens-per-minute (TPM) limits. Instead of firing requests until the API
+answers 429, a shared RateLimiter holds each call back until both token
+buckets have capacity, and retries the occasional 429 with exponential
+backoff.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Callable, Optional
+
+from openai import RateLimitError
+
+
+# Attempts per call (first try + retries) on RateLimitError
+MAX_ATTEMPTS = 5
+
+# Tokens reserved for the completion of each request
+COMPLETION_TOKEN_ALLOWANCE = 512
+
+
+def estimate_tokens(*texts: str, completion: int = COMPLETION_TOKEN_ALLOWANCE) -> int:
+    """Rough token cost of a request: prompt (about 4 chars/token) + completion."""
+    return sum(len(t) for t in texts) // 4 + completion
+
+
+class RateLimiter:
+    """
+    Two token buckets (requests/min, tokens/min) shared by all threads.
+
+    A bucket refills continuously at its per-minute rate and holds at most
+    one minute's worth. Either limit may be None to leave it unlimited.
+    """
+
+    def __init__(self, rpm: Optional[float] = None, tpm: Optional[float] = None):
+        """
+        Args:
+            rpm: Requests per minute allowed (None = unlimited)
+            tpm: Tokens per minute allowed (None = unlimited)
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm or 0)
+        self._tokens = float(tpm or 0)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited = 0.0
+        self.retries = 0
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rpm:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60.0)
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60.0)
+
+    def acquire(self, tokens: int = 0):
+        """Block until one request of about `tokens` tokens may be sent."""
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                # A request larger than the whole bucket waits for a full one
+                need = min(tokens, self.tpm) if self.tpm else 0
+                wait = 0.0
+                if self.rpm and self._requests < 1:
+                    wait = (1 - self._requests) * 60.0 / self.rpm
+                if self.tpm and self._tokens < need:
+                    wait = max(wait, (need - self._tokens) * 60.0 / self.tpm)
+                if wait <= 0:
+                    if self.rpm:
+                        self._requests -= 1
+                    if self.tpm:
+                        self._tokens -= need
+                    return
+                self.waited += wait
+            time.sleep(wait)
+
+    def call(self, fn: Callable, *args, tokens: int = 0, **kwargs):
+        """
+        Call fn(*args, **kwargs) within the limits.
+
+        Retries on RateLimitError with exponential backoff and jitter, up
+        to MAX_ATTEMPTS attempts in total.
+        """
+        for attempt in range(MAX_ATTEMPTS):
+            self.acquire(tokens)
+            try:
+                return fn(*args, **kwargs)
+            except RateLimitError:
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise
+                with self._lock:
+                    self.retries += 1
+                time.sleep(2 ** attempt + random.random())
+
+    async def acall(self, fn: Callable, *args, tokens: int = 0, **kwargs):
+        """
+        Awaitable call() for coroutine functions.
+
+        Waiting for the buckets happens in a worker thread and backoff uses
+        asyncio.sleep, so neither blocks the event loop.
+        """
+        for attempt in range(MAX_ATTEMPTS):
+            await asyncio.to_thread(self.acquire, tokens)
+            try:
+                return await fn(*args, **kwargs)
+            except RateLimitError:
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise
+                with self._lock:
+                    self.retries += 1
+                await asyncio.sleep(2 ** attempt + random.random())
@@ -0,0 +1,141 @@
+"""
+result_cache.py
+Persistent cache for extraction and validation results.
+
+Triple extraction (an LLM call) and ontology validation (a reasoner run) are
+the expensive stages of a query. Both are pure functions of their inputs, so
+their results are stored in a small SQLite file keyed by a content hash:
+
+- Extraction:  model + system prompt + input text
+- Validation:  canonical JSON of the triples + ontology fingerprint
+
+The ontology fingerprint covers the RDF files and the owlready2 cache, so
+editing the ontology invalidates all stored verdicts.
+"""
+
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Iterable, List, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json fallback
+    orjson = None
+
+
+class ResultCache:
+    """
+    Content-addressed key/value store backed by SQLite.
+
+    Values are pickled. Safe to share between the worker threads of
+    concurrent queries. Entries that no longer unpickle (e.g. after a
+    result class changed layout) count as misses and are recomputed.
+    """
+
+    def __init__(self, cache_dir: str = ".ovrag_cache"):
+        """
+        Open (or create) the cache.
+
+        Args:
+            cache_dir: Directory holding results.sqlite3
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.cache_dir / "results.sqlite3"), check_same_thread=False
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash the given string parts into a cache key."""
+        h = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        value = None
+        if row is not None:
+            try:
+                value = pickle.loads(row[0])
+            except Exception:
+                value = None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any):
+        """Store value under key."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)", (key, blob)
+            )
+            self._conn.commit()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 if none yet)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def canonical_triples(triples: List[Dict]) -> str:
+    """
+    Order-independent JSON form of a triple list, for cache keys.
+
+    The stdlib fallback writes the same compact, non-ASCII-escaped JSON as
+    orjson (and UTF-8 byte order matches str order), so a cache directory
+    gives the same keys with or without orjson installed.
+    """
+    if orjson is not None:
+        items = sorted(orjson.dumps(t, option=orjson.OPT_SORT_KEYS) for t in triples)
+        return (b"[" + b",".join(items) + b"]").decode("utf-8")
+    items = sorted(
+        json.dumps(t, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        for t in triples
+    )
+    return "[" + ",".join(items) + "]"
+
+
+def ontology_fingerprint(ontology_dir: str, extra_files: Iterable[str] = ()) -> str:
+    """
+    Fingerprint of the ontology files a validation depends on.
+
+    Uses path, size and mtime of every .rdf file under ontology_dir plus
+    any extra_files (e.g. the owlready2 SQLite cache).
+    """
+    entries = []
+    paths = sorted(Path(ontology_dir).glob("**/*.rdf")) + [Path(f) for f in extra_files]
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append(f"{path}:{st.st_size}:{st.st_mtime_ns}")
+    return ResultCache.make_key(*entries)
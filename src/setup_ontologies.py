@@ -7,11 +7,15 @@ Required FIBO Modules:
 2. BE (Business Entities): Legal Persons, Corporations, Corporate Control
 """
 
+import json
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 
 
 # FIBO Base URL
@@ -40,44 +44,126 @@ DIRECT_URLS = {
 }
 
 
-def download_file(url: str, destination: Path, timeout: int = 30) -> bool:
+# Parallel downloads (all files come from the same host)
+MAX_DOWNLOAD_WORKERS = 5
+
+# Bytes written per streamed chunk
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+
+def make_session() -> requests.Session:
+    """
+    Create a session that reuses connections and retries transient errors.
+
+    Returns:
+        requests.Session with a pooled, retrying HTTPS adapter
+    """
+    session = requests.Session()
+    retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(
+        pool_connections=MAX_DOWNLOAD_WORKERS,
+        pool_maxsize=MAX_DOWNLOAD_WORKERS,
+        max_retries=retry
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _meta_path(destination: Path) -> Path:
+    """Sidecar file holding the ETag/Last-Modified of a downloaded file."""
+    return destination.with_name(destination.name + ".meta.json")
+
+
+def _conditional_headers(destination: Path) -> Dict[str, str]:
+    """
+    Build If-None-Match/If-Modified-Since headers for an existing download.
+
+    Returns an empty dict if the file or its sidecar is missing or unreadable.
+    """
+    if not destination.exists():
+        return {}
+    try:
+        meta = json.loads(_meta_path(destination).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def download_file(
+    url: str,
+    destination: Path,
+    timeout: int = 30,
+    session: Optional[requests.Session] = None
+) -> bool:
     """
     Download a file from a URL to a local destination.
 
+    The response is streamed to a temporary file next to destination and
+    renamed once complete, so an interrupted download never leaves a
+    truncated file that a later run would skip as already present.
+
+    The ETag and Last-Modified headers are stored in a .meta.json sidecar.
+    If destination already exists, the request is made conditional on
+    them and a 304 Not Modified response keeps the local copy.
+
     Args:
         url: The URL to download from
         destination: The local file path to save to
         timeout: Request timeout in seconds
+        session: Session to download with (None = a one-off request)
 
     Returns:
-        bool: True if successful, False otherwise
+        bool: True if successful (or unchanged), False otherwise
     """
+    partial = destination.with_name(destination.name + ".part")
+    headers = _conditional_headers(destination)
     try:
         print(f"Downloading: {url}")
-        response = requests.get(url, timeout=timeout, allow_redirects=True)
-        response.raise_for_status()
-
-        # Ensure parent directory exists
-        destination.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write the file
-        with open(destination, 'wb') as f:
-            f.write(response.content)
+        getter = session.get if session is not None else requests.get
+        with getter(url, headers=headers, timeout=timeout,
+                    allow_redirects=True, stream=True) as response:
+            if response.status_code == 304:
+                print(f"[i] Not modified: {destination}")
+                return True
+            response.raise_for_status()
+            meta = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+
+            # Ensure parent directory exists
+            destination.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write the file
+            with open(partial, 'wb') as f:
+                for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        partial.replace(destination)
+        _meta_path(destination).write_text(json.dumps(meta), encoding="utf-8")
 
         print(f"[OK] Saved to: {destination}")
         return True
 
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, OSError) as e:
+        partial.unlink(missing_ok=True)
         print(f"[X] Failed to download {url}: {e}")
         return False
 
 
-def setup_ontologies(ontology_dir: str = "ontologies") -> bool:
+def setup_ontologies(ontology_dir: str = "ontologies", refresh: bool = False) -> bool:
     """
     Download all required FIBO ontology modules.
 
     Args:
         ontology_dir: Directory to save ontology files
+        refresh: Re-check existing files with the server and update the
+            ones that changed (conditional GET) instead of skipping them
 
     Returns:
         bool: True if all downloads successful
@@ -94,20 +180,25 @@ def setup_ontologies(ontology_dir: str = "ontologies") -> bool:
     success_count = 0
     total_count = len(DIRECT_URLS)
 
-    # Download each ontology file
+    # Skip files that already exist, unless refreshing them
+    pending = []
     for filename, url in DIRECT_URLS.items():
         destination = ontology_path / filename
-
-        # Skip if already exists
-        if destination.exists():
+        if destination.exists() and not refresh:
             print(f"[i] Already exists: {filename}")
             success_count += 1
-            continue
-
-        # Download the file
-        if download_file(url, destination):
-            success_count += 1
-
+        else:
+            pending.append((url, destination))
+
+    # Download the rest in parallel over one pooled session
+    if pending:
+        with make_session() as session, \
+                ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as pool:
+            results = list(pool.map(
+                lambda item: download_file(item[0], item[1], session=session),
+                pending
+            ))
+        success_count += sum(results)
         print()
 
     # Summary
@@ -164,10 +255,10 @@ def verify_ontologies(ontology_dir: str = "ontologies") -> bool:
 if __name__ == "__main__":
     import sys
 
-    # Check for verify flag
+    # Check for verify/refresh flags
     if len(sys.argv) > 1 and sys.argv[1] == "--verify":
         success = verify_ontologies()
     else:
-        success = setup_ontologies()
+        success = setup_ontologies(refresh="--refresh" in sys.argv[1:])
 
     sys.exit(0 if success else 1)
@@ -15,6 +15,7 @@ import os
 import re
 import shutil
 import tempfile
+import threading
 from pathlib import Path
 
 # Project root (parent of src/)
@@ -34,6 +35,8 @@ from owlready2 import (
 )
 import owlready2
 
+from console import log
+
 # CRITICAL: Set Java heap memory for reasoners
 # Default is 512MB which is insufficient for complex ontologies
 # Increase to 4GB (adjust based on available system RAM)
@@ -44,6 +47,25 @@ owlready2.reasoning.JAVA_MEMORY = 4000
 # annotations in the FIBO/LOAN TBox, even after cleaning 204+ language tags.
 REASONER_FALLBACK_MODE = 'pellet'
 
+# owlready2 keeps the active ontology context in module-level state and each
+# validation rebuilds the world, so only one validation may run at a time
+# (concurrent queries still overlap their LLM calls around it).
+_VALIDATION_LOCK = threading.Lock()
+
+# Runs of characters not allowed in individual names (underscores included,
+# so existing runs collapse too), replaced by a single underscore
+_NAME_SEPARATOR_RE = re.compile(r'[^a-zA-Z0-9]+')
+
+# Term sets used for membership tests on every triple
+_TYPE_PREDICATES = frozenset({"rdf:type", "type"})
+_LITERAL_TYPES = frozenset({"literal", "description", "string", "boolean"})
+_LOAN_TYPES = frozenset({
+    "CommercialLoan", "ConsumerLoan", "Mortgage",
+    "StudentLoan", "SubsidizedStudentLoan", "GreenLoan",
+    "SecuredLoan", "UnsecuredLoan", "OpenEndCredit",
+    "ClosedEndCredit", "Loan",
+})
+
 
 @dataclass
 class ValidationResult:
@@ -51,6 +73,9 @@ class ValidationResult:
     is_valid: bool
     explanation: str
     inconsistent_triples: List[Dict] = None
+    # False if the verdict was reached without a full reasoner run (reasoner
+    # unavailable or crashed); such results must not be cached
+    reasoning_complete: bool = True
 
     def __str__(self) -> str:
         status = "[OK] VALID" if self.is_valid else "[X] INVALID"
@@ -76,6 +101,13 @@ class OntologyValidator:
         self.world = None
         self.onto = None
         self.loan_namespaces = {}
+        # True while self.world is a private, uncontaminated copy that the
+        # next validation may use without reloading
+        self._world_reusable = False
+        # name -> entity lookups, built once per loaded World
+        self._index_world = None
+        self._class_index = {}
+        self._property_index = {}
 
         # Verify ontology files exist
         if not self._verify_ontologies():
@@ -84,9 +116,9 @@ class OntologyValidator:
                 "Ensure your LOAN ontology files are in the correct directory structure."
             )
 
-        print("Initializing LOAN Ontology Validator...")
+        log("Initializing LOAN Ontology Validator...")
         self._load_ontologies()
-        print("[OK] Validator ready")
+        log("[OK] Validator ready")
 
     def _verify_ontologies(self) -> bool:
         """Check if required ontology files exist."""
@@ -100,7 +132,7 @@ class OntologyValidator:
 
         for file_path in loan_ontology_paths:
             if not file_path.exists():
-                print(f"[X] Missing: {file_path}")
+                log(f"[X] Missing: {file_path}")
                 return False
 
         return True
@@ -128,7 +160,7 @@ class OntologyValidator:
             self._build_cache()
         except RuntimeError:
             # Network unavailable — load local files only
-            print("  [!] FIBO servers unreachable, loading local files only")
+            log("  [!] FIBO servers unreachable, loading local files only")
             self._load_local_only()
 
     def _build_cache(self):
@@ -138,19 +170,19 @@ class OntologyValidator:
 
             for file_path in self._ontology_paths():
                 if file_path.exists():
-                    print(f"  Loading: {file_path.name}")
+                    log(f"  Loading: {file_path.name}")
                     onto = self.world.get_ontology(f"file://{file_path.absolute()}").load()
                     if self.onto is None:
                         self.onto = onto
 
-            print(f"[OK] Loaded LOAN ontology modules (with FIBO imports)")
+            log(f"[OK] Loaded LOAN ontology modules (with FIBO imports)")
 
             # Pre-clean language tags so cached copies are already clean
             self._clean_language_tags()
 
             # Persist to SQLite
             self.world.save()
-            print(f"[OK] Ontology cache saved to {self.CACHE_FILE}")
+            log(f"[OK] Ontology cache saved to {self.CACHE_FILE}")
 
         except Exception as e:
             # Close world and remove partial cache on failure
@@ -170,13 +202,14 @@ class OntologyValidator:
 
             self.world = World(filename=tmp)
             self.onto = next(iter(self.world.ontologies()), None)
+            self._world_reusable = True
 
             n_classes = len(list(self.world.classes()))
-            print(f"[OK] Loaded ontologies from cache ({n_classes} classes)")
+            log(f"[OK] Loaded ontologies from cache ({n_classes} classes)")
 
         except Exception as e:
             # Cache corrupted — rebuild or fall back to local
-            print(f"  [!] Cache load failed ({e}), falling back to local files")
+            log(f"  [!] Cache load failed ({e}), falling back to local files")
             self.CACHE_FILE.unlink(missing_ok=True)
             self._load_local_only()
 
@@ -206,7 +239,7 @@ class OntologyValidator:
         try:
             for file_path in self._ontology_paths():
                 if file_path.exists():
-                    print(f"  Loading (local): {file_path.name}")
+                    log(f"  Loading (local): {file_path.name}")
                     onto = self.world.get_ontology(f"file://{file_path.absolute()}").load(only_local=True)
                     if self.onto is None:
                         self.onto = onto
@@ -216,8 +249,10 @@ class OntologyValidator:
         # Clean language tags on the locally-loaded data
         self._clean_language_tags()
 
+        self._world_reusable = True
+
         n_classes = len(list(self.world.classes()))
-        print(f"[OK] Loaded local LOAN ontology ({n_classes} classes, no FIBO imports)")
+        log(f"[OK] Loaded local LOAN ontology ({n_classes} classes, no FIBO imports)")
 
     def _ontology_paths(self):
         """Return the list of local LOAN ontology file paths."""
@@ -235,19 +270,107 @@ class OntologyValidator:
         """
         Recreate a clean World with ontologies.
 
-        Must be called before each validation to prevent contamination
-        from previous validation attempts (e.g., leftover individuals
-        or inferred axioms from the correction loop).
+        Guarantees isolation from previous validations (leftover individuals
+        or inferred axioms); _prepare_world() falls back to it whenever the
+        current World cannot be cleaned in place.
 
         Loads from the SQLite cache if available, otherwise from local files.
         """
         self.world = None
         self.onto = None
+        self._world_reusable = False
         if self.CACHE_FILE.exists():
             self._load_from_cache()
         else:
             self._load_local_only()
 
+    # Ontologies a validation adds to the World: the temporary ABox and the
+    # facts written back by the reasoner (owlready2's "inferrences" ontology)
+    _VALIDATION_ONTOLOGY_IRIS = ("http://temp.validation.onto#", "http://inferrences/")
+
+    def _prepare_world(self):
+        """
+        Make sure the World holds only the TBox before a validation.
+
+        The World loaded at startup is reused across validations; what a
+        validation adds (individuals, reasoner inferences) is destroyed again
+        by _discard_validation_state(). A full reload only happens when the
+        World is the persistent cache itself (first build) or cleanup failed.
+        """
+        if not self._world_reusable:
+            self._reload_world()
+
+    def warm_up(self):
+        """
+        Do the one-off work of the first validation ahead of time.
+
+        Prepares a reusable World (a reload right after the initial cache
+        build) and builds the class/property name index.
+        """
+        with _VALIDATION_LOCK:
+            self._prepare_world()
+            self._ensure_name_index()
+
+    def start_warm_up(self) -> threading.Thread:
+        """Run warm_up() in a background thread; validations wait for it."""
+        thread = threading.Thread(target=self.warm_up, name="validator-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    def _discard_validation_state(self):
+        """
+        Destroy the ontologies a validation added to the World.
+
+        destroy() also refreshes the cached relations and types of entities
+        outside the destroyed ontology. Inferred class-level axioms (e.g. a
+        new superclass of a TBox class) are not refreshed that way, so if the
+        reasoner wrote back anything about an entity other than the temporary
+        individuals, the World is reloaded before the next validation.
+        """
+        try:
+            temp_onto, inferred = (
+                self.world.ontologies.get(iri) for iri in self._VALIDATION_ONTOLOGY_IRIS
+            )
+            if inferred is not None and self._inferred_beyond_abox(inferred, temp_onto):
+                self._world_reusable = False
+            for onto in (inferred, temp_onto):
+                if onto is not None:
+                    onto.destroy(update_relation=True, update_is_a=True)
+        except Exception as e:
+            log(f"  [!] Could not reset ontology world ({e}), reloading next time")
+            self._world_reusable = False
+
+    def _inferred_beyond_abox(self, inferred, temp_onto) -> bool:
+        """True if the reasoner wrote facts about anything but temp_onto's individuals."""
+        graph = inferred.graph
+        for (storid,) in graph.execute("SELECT DISTINCT s FROM quads WHERE c=?", (graph.c,)):
+            if storid == inferred.storid:
+                continue  # the ontology's own header
+            if storid < 0:
+                return True  # anonymous class expression
+            entity = self.world._get_by_storid(storid)
+            if entity is None or temp_onto is None or entity.namespace.ontology is not temp_onto:
+                return True
+        return False
+
+    def _ensure_name_index(self):
+        """
+        Index classes and properties of the current World by short name.
+
+        Replaces a linear scan over every FIBO class per lookup with one pass
+        per World (rebuilt only when the World is reloaded). The first entity
+        seen for a name wins, matching the former scan order.
+        """
+        if self._index_world is self.world:
+            return
+        self._class_index = {}
+        for cls in self.world.classes():
+            self._class_index.setdefault(cls.name, cls)
+        self._property_index = {}
+        for prop in self.world.properties():
+            self._property_index.setdefault(prop.name, prop)
+        self._index_world = self.world
+
     def _get_class_by_name(self, class_name: str):
         """
         Get an ontology class by its short name or CURIE.
@@ -263,12 +386,12 @@ class OntologyValidator:
         if ":" in class_name:
             class_name = class_name.split(":")[-1]
 
-        # Search through all classes in the world
-        for cls in self.world.classes():
-            if cls.name == class_name:
-                return cls
+        self._ensure_name_index()
+        cls = self._class_index.get(class_name)
+        if cls is not None:
+            return cls
 
-        print(f"Warning: Class '{class_name}' not found in ontology")
+        log(f"Warning: Class '{class_name}' not found in ontology")
         return None
 
     def _get_property_by_name(self, property_name: str):
@@ -285,18 +408,17 @@ class OntologyValidator:
         if ":" in property_name:
             property_name = property_name.split(":")[-1]
 
-        # Search through all properties in the world
-        for prop in self.world.properties():
-            if prop.name == property_name:
-                return prop
+        self._ensure_name_index()
+        prop = self._property_index.get(property_name)
+        if prop is not None:
+            return prop
 
-        print(f"Warning: Property '{property_name}' not found in ontology")
+        log(f"Warning: Property '{property_name}' not found in ontology")
         return None
 
     def _sanitize_name(self, name: str) -> str:
         """Sanitize a string for use as an OWL individual name."""
-        sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', name)
-        sanitized = re.sub(r'_+', '_', sanitized).strip('_')
+        sanitized = _NAME_SEPARATOR_RE.sub('_', name).strip('_')
         if sanitized and sanitized[0].isdigit():
             sanitized = 'n' + sanitized
         return sanitized or 'unnamed'
@@ -335,7 +457,7 @@ class OntologyValidator:
         cmns-av:explanatoryNote) on classes/properties carry language tags
         that HermiT cannot handle.
         """
-        print("  Cleaning language tags from ontology data...")
+        log("  Cleaning language tags from ontology data...")
         cleaned_count = 0
 
         # Clean TBox: classes and properties (where most language tags live)
@@ -351,9 +473,9 @@ class OntologyValidator:
             cleaned_count += self._clean_entity_language_tags(entity)
 
         if cleaned_count > 0:
-            print(f"  Cleaned {cleaned_count} language-tagged string(s)")
+            log(f"  Cleaned {cleaned_count} language-tagged string(s)")
         else:
-            print("  No language tags found")
+            log("  No language tags found")
 
         return cleaned_count
 
@@ -450,10 +572,10 @@ class OntologyValidator:
 
         # If we already know HermiT doesn't work, use Pellet directly
         if REASONER_FALLBACK_MODE == 'pellet':
-            print("  Running Pellet reasoner...")
+            log("  Running Pellet reasoner...")
             try:
                 sync_reasoner_pellet(self.world, infer_property_values=True, debug=0)
-                print("  [OK] Pellet reasoning complete - ontology is consistent")
+                log("  [OK] Pellet reasoning complete - ontology is consistent")
                 return True
             except OwlReadyInconsistentOntologyError:
                 # Re-raise inconsistency errors
@@ -463,16 +585,16 @@ class OntologyValidator:
                 # Java WARNINGs (e.g. unsupported axioms) are non-fatal —
                 # Pellet still completed reasoning, just skipped some axioms
                 if "WARNING" in error_msg:
-                    print(f"  [OK] Pellet reasoning complete (with warnings)")
+                    log(f"  [OK] Pellet reasoning complete (with warnings)")
                     return True
-                print(f"  [!] Pellet reasoner error: {error_msg[:200]}")
+                log(f"  [!] Pellet reasoner error: {error_msg[:200]}")
                 return False
 
         # Try HermiT first
-        print("  Running HermiT reasoner...")
+        log("  Running HermiT reasoner...")
         try:
             sync_reasoner_hermit(self.world, infer_property_values=True, debug=0)
-            print("  [OK] HermiT reasoning complete - ontology is consistent")
+            log("  [OK] HermiT reasoning complete - ontology is consistent")
             return True
         except OwlReadyInconsistentOntologyError:
             # This is what we want to catch - actual inconsistencies!
@@ -482,8 +604,8 @@ class OntologyValidator:
 
             # Check if it's the langString error
             if "langString" in error_msg or "UnsupportedDatatypeException" in error_msg:
-                print("  [!] HermiT cannot handle langString datatype in ontology schema")
-                print("  [i] Falling back to Pellet reasoner...")
+                log("  [!] HermiT cannot handle langString datatype in ontology schema")
+                log("  [i] Falling back to Pellet reasoner...")
 
                 # Set global flag to use Pellet for future validations
                 REASONER_FALLBACK_MODE = 'pellet'
@@ -491,41 +613,56 @@ class OntologyValidator:
                 # Try Pellet
                 try:
                     sync_reasoner_pellet(self.world, infer_property_values=True, debug=0)
-                    print("  [OK] Pellet reasoning complete - ontology is consistent")
+                    log("  [OK] Pellet reasoning complete - ontology is consistent")
                     return True
                 except OwlReadyInconsistentOntologyError:
                     # Re-raise inconsistency errors
                     raise
                 except Exception as pellet_error:
-                    print(f"  [X] Pellet also failed: {str(pellet_error)[:200]}")
-                    print("  [!] WARNING: Could not perform full semantic reasoning")
+                    log(f"  [X] Pellet also failed: {str(pellet_error)[:200]}")
+                    log("  [!] WARNING: Could not perform full semantic reasoning")
                     return False
             else:
                 # Different HermiT error
-                print(f"  [!] HermiT error: {error_msg[:200]}")
-                print("  [!] WARNING: Could not perform full semantic reasoning")
+                log(f"  [!] HermiT error: {error_msg[:200]}")
+                log("  [!] WARNING: Could not perform full semantic reasoning")
                 return False
 
     def validate_triples(self, triples: List[Dict]) -> ValidationResult:
         """
         Validate a list of extracted triples against FIBO ontology.
 
+        Thread-safe: calls from concurrent queries are serialized.
+
         Args:
             triples: List of dicts with keys: sub, pred, obj, sub_type, obj_type
 
         Returns:
             ValidationResult object with validation status and explanation
         """
+        with _VALIDATION_LOCK:
+            return self._validate_triples(triples)
+
+    def _validate_triples(self, triples: List[Dict]) -> ValidationResult:
+        """Body of validate_triples(); caller must hold _VALIDATION_LOCK."""
         if not triples:
             return ValidationResult(
                 is_valid=True,
                 explanation="No triples to validate"
             )
 
-        # Reload a clean world to prevent contamination between attempts
-        self._reload_world()
+        if not self._is_grounded(triples):
+            # Every individual would be a bare Thing without ontology
+            # properties, which the reasoner cannot find inconsistent;
+            # only the rule-based role constraints can still fail
+            log("\nNo triple maps to a LOAN class or property - skipping reasoner")
+            return self._role_constraint_result(triples)
 
-        print(f"\nValidating {len(triples)} triple(s)...")
+        # Start from a clean TBox-only world to prevent contamination
+        # between attempts (leftover individuals or inferred axioms)
+        self._prepare_world()
+
+        log(f"\nValidating {len(triples)} triple(s)...")
 
         try:
             # Create a temporary ontology for this validation
@@ -543,31 +680,31 @@ class OntologyValidator:
                     pred_name = triple.get("pred")
 
                     if not sub_name or not pred_name or not obj_name:
-                        print(f"  Skipping triple with missing fields: {triple}")
+                        log(f"  Skipping triple with missing fields: {triple}")
                         continue
 
                     # Handle rdf:type assertions specially
-                    if pred_name in ["rdf:type", "type"]:
+                    if pred_name in _TYPE_PREDICATES:
                         target_class = self._get_class_by_name(obj_name)
 
                         if sub_name not in individuals:
                             # First type assertion — create the individual
                             if target_class:
                                 individuals[sub_name] = target_class(self._sanitize_name(sub_name))
-                                print(f"  Created: {sub_name} as {obj_name}")
+                                log(f"  Created: {sub_name} as {obj_name}")
                             else:
                                 sub_class = self._get_class_by_name(sub_type)
                                 if sub_class:
                                     individuals[sub_name] = sub_class(self._sanitize_name(sub_name))
-                                    print(f"  Created: {sub_name} as {sub_type} (type assertion)")
+                                    log(f"  Created: {sub_name} as {sub_type} (type assertion)")
                                 else:
                                     individuals[sub_name] = Thing(self._sanitize_name(sub_name))
-                                    print(f"  Created: {sub_name} as Thing (fallback)")
+                                    log(f"  Created: {sub_name} as Thing (fallback)")
                         else:
                             # Additional type assertion — add class to existing individual
                             if target_class:
                                 individuals[sub_name].is_a.append(target_class)
-                                print(f"  Added type: {sub_name} also a {obj_name}")
+                                log(f"  Added type: {sub_name} also a {obj_name}")
 
                         continue  # Skip property assertion for type triples
 
@@ -576,23 +713,23 @@ class OntologyValidator:
                         sub_class = self._get_class_by_name(sub_type)
                         if sub_class:
                             individuals[sub_name] = sub_class(self._sanitize_name(sub_name))
-                            print(f"  Created: {sub_name} as {sub_type}")
+                            log(f"  Created: {sub_name} as {sub_type}")
                         else:
                             # Fallback to Thing if class not found
                             individuals[sub_name] = Thing(self._sanitize_name(sub_name))
-                            print(f"  Created: {sub_name} as Thing (fallback)")
+                            log(f"  Created: {sub_name} as Thing (fallback)")
 
                     # Create object individual — skip for literals
-                    if obj_type and obj_type.lower() in ("literal", "description", "string", "boolean"):
-                        print(f"  Literal object: {obj_name} (type={obj_type}), skipping individual creation")
+                    if obj_type and obj_type.lower() in _LITERAL_TYPES:
+                        log(f"  Literal object: {obj_name} (type={obj_type}), skipping individual creation")
                     elif obj_name not in individuals:
                         obj_class = self._get_class_by_name(obj_type)
                         if obj_class:
                             individuals[obj_name] = obj_class(self._sanitize_name(obj_name))
-                            print(f"  Created: {obj_name} as {obj_type}")
+                            log(f"  Created: {obj_name} as {obj_type}")
                         else:
                             individuals[obj_name] = Thing(self._sanitize_name(obj_name))
-                            print(f"  Created: {obj_name} as Thing (fallback)")
+                            log(f"  Created: {obj_name} as Thing (fallback)")
 
                 # Step 2: Assert properties (relations) - skip rdf:type
                 for triple in triples:
@@ -602,7 +739,7 @@ class OntologyValidator:
                     obj_type = triple.get("obj_type")
 
                     # Skip type assertions as they were handled in Step 1
-                    if pred_name in ["rdf:type", "type"]:
+                    if pred_name in _TYPE_PREDICATES:
                         continue
 
                     if not sub_name or not pred_name or not obj_name:
@@ -610,16 +747,16 @@ class OntologyValidator:
 
                     sub_individual = individuals.get(sub_name)
                     if not sub_individual:
-                        print(f"  Warning: Subject '{sub_name}' not found for property assertion")
+                        log(f"  Warning: Subject '{sub_name}' not found for property assertion")
                         continue
 
                     property_obj = self._get_property_by_name(pred_name)
                     if not property_obj:
-                        print(f"  Warning: Property {pred_name} not found")
+                        log(f"  Warning: Property {pred_name} not found")
                         continue
 
                     # Decide: data property (literal value) vs object property (individual)
-                    is_literal = obj_type and obj_type.lower() in ("literal", "description", "string", "boolean")
+                    is_literal = obj_type and obj_type.lower() in _LITERAL_TYPES
                     is_data_prop = self._is_data_property(property_obj)
 
                     if is_literal or is_data_prop:
@@ -631,14 +768,14 @@ class OntologyValidator:
                                 prop_list.append(value)
                             else:
                                 setattr(sub_individual, property_obj.name, [value])
-                            print(f"  Asserted (data): {sub_name} {pred_name} {value!r}")
+                            log(f"  Asserted (data): {sub_name} {pred_name} {value!r}")
                         except (AttributeError, ValueError, TypeError) as exc:
-                            print(f"  Warning: Could not assert data property {pred_name}: {exc}")
+                            log(f"  Warning: Could not assert data property {pred_name}: {exc}")
                     else:
                         # Object property path: use individual
                         obj_individual = individuals.get(obj_name)
                         if not obj_individual:
-                            print(f"  Warning: Object '{obj_name}' not found for property assertion")
+                            log(f"  Warning: Object '{obj_name}' not found for property assertion")
                             continue
                         try:
                             prop_list = getattr(sub_individual, property_obj.name, None)
@@ -646,46 +783,23 @@ class OntologyValidator:
                                 prop_list.append(obj_individual)
                             else:
                                 setattr(sub_individual, property_obj.name, [obj_individual])
-                            print(f"  Asserted: {sub_name} {pred_name} {obj_name}")
+                            log(f"  Asserted: {sub_name} {pred_name} {obj_name}")
                         except (AttributeError, ValueError, TypeError) as exc:
-                            print(f"  Warning: Could not assert {pred_name}: {exc}")
+                            log(f"  Warning: Could not assert {pred_name}: {exc}")
 
                 # Step 3: Run the reasoner with automatic fallback to Pellet if needed
                 # (Language tags are pre-cleaned in the SQLite cache)
-                print()
+                log()
                 reasoning_succeeded = self._run_reasoner_with_fallback()
 
                 if not reasoning_succeeded:
-                    print("\n  [!] WARNING: Full semantic reasoning could not be completed")
-                    print("  [i] Basic structural validation passed (no immediate inconsistencies)")
-                    print("  [i] Consider using a langString-compatible ontology version")
+                    log("\n  [!] WARNING: Full semantic reasoning could not be completed")
+                    log("  [i] Basic structural validation passed (no immediate inconsistencies)")
+                    log("  [i] Consider using a langString-compatible ontology version")
 
             # If we reach here, ontology is consistent (no disjointness violations).
             # Now check rule-based role constraints that OWL cannot express.
-            role_violations = self._check_role_constraints(triples)
-            if role_violations:
-                explanation_parts = [
-                    "ROLE CONSTRAINT VIOLATION DETECTED",
-                    "=" * 60,
-                    "",
-                ]
-                for v in role_violations:
-                    explanation_parts.append(f"• {v}")
-                explanation_parts.append("")
-                explanation_parts.append("These assertions violate LOAN ontology role constraints.")
-                return ValidationResult(
-                    is_valid=False,
-                    explanation="\n".join(explanation_parts),
-                    inconsistent_triples=triples
-                )
-
-            return ValidationResult(
-                is_valid=True,
-                explanation=(
-                    "All triples are logically consistent with LOAN ontology.\n"
-                    f"Validated {len(triples)} assertion(s) successfully."
-                )
-            )
+            return self._role_constraint_result(triples, reasoning_succeeded)
 
         except OwlReadyInconsistentOntologyError as e:
             # Ontology is inconsistent - this is what we want to detect!
@@ -702,9 +816,68 @@ class OntologyValidator:
             error_detail = str(e) if str(e) else repr(e)
             return ValidationResult(
                 is_valid=False,
-                explanation=f"Validation error: {type(e).__name__}: {error_detail}"
+                explanation=f"Validation error: {type(e).__name__}: {error_detail}",
+                reasoning_complete=False
             )
 
+        finally:
+            self._discard_validation_state()
+
+    def _is_grounded(self, triples: List[Dict]) -> bool:
+        """
+        Whether any triple refers to a class or property of the ontology.
+
+        Uses the name index only (no warnings, no individuals created).
+        """
+        self._ensure_name_index()
+        for triple in triples:
+            pred_name = triple.get("pred") or ""
+            class_names = [triple.get("sub_type"), triple.get("obj_type")]
+            if pred_name in _TYPE_PREDICATES:
+                class_names.append(triple.get("obj"))
+            elif pred_name.split(":")[-1] in self._property_index:
+                return True
+            for name in class_names:
+                if name and name.split(":")[-1] in self._class_index:
+                    return True
+        return False
+
+    def _role_constraint_result(
+        self, triples: List[Dict], reasoning_complete: bool = True
+    ) -> ValidationResult:
+        """
+        Final verdict once the reasoner found no inconsistency.
+
+        reasoning_complete is False when the reasoner could not run, so the
+        absence of an inconsistency proves nothing.
+        """
+        role_violations = self._check_role_constraints(triples)
+        if role_violations:
+            explanation_parts = [
+                "ROLE CONSTRAINT VIOLATION DETECTED",
+                "=" * 60,
+                "",
+            ]
+            for v in role_violations:
+                explanation_parts.append(f"• {v}")
+            explanation_parts.append("")
+            explanation_parts.append("These assertions violate LOAN ontology role constraints.")
+            return ValidationResult(
+                is_valid=False,
+                explanation="\n".join(explanation_parts),
+                inconsistent_triples=triples,
+                reasoning_complete=reasoning_complete
+            )
+
+        return ValidationResult(
+            is_valid=True,
+            explanation=(
+                "All triples are logically consistent with LOAN ontology.\n"
+                f"Validated {len(triples)} assertion(s) successfully."
+            ),
+            reasoning_complete=reasoning_complete
+        )
+
     def _check_role_constraints(self, triples: List[Dict]) -> List[str]:
         """
         Check rule-based role constraints that OWL disjointness cannot express.
@@ -723,7 +896,6 @@ class OntologyValidator:
 
         # Collect type assertions and role assertions per entity
         entity_types = {}  # entity_name -> set of types
-        loan_types = set()
         lender_entities = set()
         borrower_entities = set()
 
@@ -733,7 +905,7 @@ class OntologyValidator:
             obj = triple.get("obj", "")
             sub_type = triple.get("sub_type", "")
 
-            if pred in ("rdf:type", "type"):
+            if pred in _TYPE_PREDICATES:
                 entity_types.setdefault(sub, set()).add(obj)
             if pred in ("hasLender", "providesLoan"):
                 lender_entities.add(obj if pred == "hasLender" else sub)
@@ -745,13 +917,7 @@ class OntologyValidator:
                 entity_types.setdefault(sub, set()).add(sub_type)
 
         # Collect loan types from TheLoan or any loan entity
-        for entity, types in entity_types.items():
-            for t in types:
-                if t in ("CommercialLoan", "ConsumerLoan", "Mortgage",
-                         "StudentLoan", "SubsidizedStudentLoan", "GreenLoan",
-                         "SecuredLoan", "UnsecuredLoan", "OpenEndCredit",
-                         "ClosedEndCredit", "Loan"):
-                    loan_types.add(t)
+        loan_types = _LOAN_TYPES.intersection(set().union(*entity_types.values()))
 
         # Check: NaturalPerson as lender for CommercialLoan or Mortgage
         for lender in lender_entities:
@@ -831,11 +997,11 @@ class OntologyValidator:
         Returns:
             ValidationResult
         """
-        print("\n" + "=" * 70)
-        print("ONTOLOGY VALIDATION")
-        print("=" * 70)
-        print(f"Answer: {answer_text[:100]}..." if len(answer_text) > 100 else f"Answer: {answer_text}")
-        print()
+        log("\n" + "=" * 70)
+        log("ONTOLOGY VALIDATION")
+        log("=" * 70)
+        log(f"Answer: {answer_text[:100]}..." if len(answer_text) > 100 else f"Answer: {answer_text}")
+        log()
 
         if not extracted_triples:
             return ValidationResult(
@@ -844,9 +1010,9 @@ class OntologyValidator:
             )
 
         result = self.validate_triples(extracted_triples)
-        print("\n" + "=" * 70)
-        print(result)
-        print("=" * 70)
+        log("\n" + "=" * 70)
+        log(result)
+        log("=" * 70)
 
         return result
 
@@ -874,8 +1040,8 @@ def validate_answer(
 
 if __name__ == "__main__":
     # Test the validator with a sample inconsistent triple
-    print("Testing Ontology Validator...")
-    print()
+    log("Testing Ontology Validator...")
+    log()
 
     # Example 1: Valid triple
     valid_triples = [
@@ -901,14 +1067,14 @@ if __name__ == "__main__":
 
     validator = OntologyValidator()
 
-    print("\n" + "="*70)
-    print("Test 1: Valid Triple")
-    print("="*70)
+    log("\n" + "="*70)
+    log("Test 1: Valid Triple")
+    log("="*70)
     result1 = validator.validate_triples(valid_triples)
-    print(result1)
+    log(result1)
 
-    print("\n" + "="*70)
-    print("Test 2: Invalid Triple (Disjointness Violation)")
-    print("="*70)
+    log("\n" + "="*70)
+    log("Test 2: Invalid Triple (Disjointness Violation)")
+    log("="*70)
     result2 = validator.validate_triples(invalid_triples)
-    print(result2)
+    log(result2)
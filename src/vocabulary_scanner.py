@@ -19,6 +19,12 @@ from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, asdict
 from xml.etree import ElementTree as ET
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional: stdlib json fallback
+    _json_loads = json.loads
+
 # Project root (parent of src/)
 _root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
 
@@ -476,8 +482,8 @@ def load_cached_prompt(cache_path: str = os.path.join(_root, "config", "vocabula
     if not os.path.exists(cache_path):
         return None
 
-    with open(cache_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(cache_path, 'rb') as f:
+        data = _json_loads(f.read())
 
     return data.get('generated_prompt')
 
@@ -0,0 +1,120 @@
+"""
+test_contract_cache.py
+Tests für den Contract-Cache von generate_test_pdfs.py
+
+Der Cache muss zwischen beiden Aufrufarten funktionieren: Skript direkt
+ausgeführt (Modul heißt __main__) und als Modul importiert
+(generate_test_pdfs). Jede Variante läuft in einem eigenen Prozess.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+_script = os.path.join(_root, "evaluation", "generate_test_pdfs.py")
+
+
+SEPARATOR = "=" * 70
+
+# Lädt das Modul entweder wie beim direkten Aufruf (Quelltext ohne den
+# __main__-Block im Namensraum von __main__) oder per Import. Im Modus
+# "read" darf nichts neu generiert werden: ein Cache-Miss schlägt fehl.
+_CHILD = '''
+import hashlib, json, random, sys
+from dataclasses import asdict
+
+path, entry, mode, cache_dir = sys.argv[1:]
+if entry == "script":
+    with open(path, encoding="utf-8") as f:
+        source = f.read().split('\\nif __name__ == "__main__":')[0]
+    __file__ = path
+    exec(compile(source, path, "exec"))
+    mod = sys.modules["__main__"]
+else:
+    sys.path.insert(0, __import__("os").path.dirname(path))
+    import generate_test_pdfs as mod
+
+mod._CACHE_DIR = cache_dir
+if mode == "read":
+    def _no_generate():
+        raise AssertionError("cache miss")
+    mod.iter_contracts = _no_generate
+
+contracts = mod.generate_all_contracts()
+assert len(contracts) == 100, len(contracts)
+assert all(type(c) is mod.LoanContract for c in contracts)
+data = json.dumps([asdict(c) for c in contracts], sort_keys=True)
+print(hashlib.sha256(data.encode()).hexdigest(), random.random())
+'''
+
+
+def _run(entry: str, mode: str, cache_dir: str) -> str:
+    """Startet einen Kindprozess und gibt dessen Ausgabe zurück."""
+    env = dict(os.environ)
+    env.pop("OVRAG_NO_CONTRACT_CACHE", None)
+    proc = subprocess.run(
+        [sys.executable, "-c", _CHILD, _script, entry, mode, cache_dir],
+        capture_output=True, text=True, env=env, timeout=300,
+    )
+    assert proc.returncode == 0, f"{entry}/{mode} fehlgeschlagen:\n{proc.stderr}"
+    return proc.stdout.strip()
+
+
+def _round_trip(writer: str, reader: str):
+    print(f"\n{SEPARATOR}")
+    print(f"TEST: Cache geschrieben als {writer}, gelesen als {reader}")
+    print(SEPARATOR)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        written = _run(writer, "write", cache_dir)
+        cache_files = [n for n in os.listdir(cache_dir) if n.startswith(".contracts_cache_")]
+        assert len(cache_files) == 1, f"Erwartet: 1 Cache-Datei, gefunden: {cache_files}"
+        print(f"  Geschrieben: {cache_files[0]}")
+
+        read = _run(reader, "read", cache_dir)
+
+    print(f"  Writer: {written}")
+    print(f"  Reader: {read}")
+    # Gleiche Verträge und gleicher Zufallszustand danach
+    assert written == read, "Cache-Treffer liefert andere Verträge als der Generator"
+    print("\n  ✅ TEST BESTANDEN")
+    return True
+
+
+def test_cache_written_by_script_read_by_import():
+    """Test: Cache aus dem Skriptlauf wird beim Import wiederverwendet."""
+    return _round_trip("script", "import")
+
+
+def test_cache_written_by_import_read_by_script():
+    """Test: Cache aus dem Import wird beim Skriptlauf wiederverwendet."""
+    return _round_trip("import", "script")
+
+
+if __name__ == "__main__":
+    results = []
+
+    results.append(("Skript → Import", test_cache_written_by_script_read_by_import()))
+    results.append(("Import → Skript", test_cache_written_by_import_read_by_script()))
+
+    # Zusammenfassung
+    print(f"\n{SEPARATOR}")
+    print("ZUSAMMENFASSUNG")
+    print(SEPARATOR)
+
+    passed = sum(1 for _, r in results if r)
+    total = len(results)
+
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"  {status}  {name}")
+
+    print(f"\nErgebnis: {passed}/{total} Tests bestanden")
+
+    if passed == total:
+        print("\n🎉 ALLE TESTS BESTANDEN!")
+    else:
+        print("\n⚠️  NICHT ALLE TESTS BESTANDEN")
+        exit(1)
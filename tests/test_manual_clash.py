@@ -16,6 +16,11 @@ Er baut eine self-contained Ontologie, die die gleichen logischen
 Strukturen wie FIBO/LOAN hat.
 """
 
+import contextlib
+import io
+import multiprocessing
+import os
+
 import owlready2
 from owlready2 import (
     get_ontology, Thing, ObjectProperty, DataProperty,
@@ -24,9 +29,13 @@ from owlready2 import (
     Not, And, Or, OneOf, Restriction
 )
 
-owlready2.reasoning.JAVA_MEMORY = 2000
+# Bis zu vier HermiT-JVMs laufen parallel. Gemessen (Temurin 25): eine
+# JVM braucht für die Mini-Ontologie höchstens ~85 MB RSS, alle Szenarien
+# bestehen noch mit 64 MB Heap; 512 MB lassen also reichlich Reserve
+owlready2.reasoning.JAVA_MEMORY = 512
 
 SEPARATOR = "=" * 70
+BANNER = "\n" + SEPARATOR
 
 
 def create_loan_ontology():
@@ -144,20 +153,61 @@ def create_loan_ontology():
     return onto
 
 
+# TBox einmal pro Prozess aufbauen (beim ersten Szenario, nicht schon beim
+# Import); die Szenarien fügen nur Individuen (ABox) hinzu, die nach jedem
+# Reasoner-Lauf wieder entfernt werden
+_ONTO = None
+
+# Hierhin schreibt sync_reasoner_hermit() die abgeleiteten Fakten
+_INFERRENCES_IRI = "http://inferrences/"
+
+
+def loan_ontology():
+    """Gibt die TBox dieses Prozesses zurück und baut sie bei Bedarf auf."""
+    global _ONTO
+    if _ONTO is None:
+        _ONTO = create_loan_ontology()
+    return _ONTO
+
+
+def reset_abox(onto):
+    """
+    Entfernt alle Individuen (ABox) und die Inferenzen des Reasoners.
+
+    Hat der Reasoner auch Fakten über TBox-Klassen zurückgeschrieben, wird
+    die ganze Ontologie verworfen und beim nächsten Szenario neu aufgebaut.
+    """
+    global _ONTO
+    individuals = list(onto.individuals())
+    inferred = onto.world.ontologies.get(_INFERRENCES_IRI)
+    if inferred is not None:
+        abox = {inferred.storid} | {individual.storid for individual in individuals}
+        graph = inferred.graph
+        subjects = {s for (s,) in graph.execute(
+            "SELECT DISTINCT s FROM quads WHERE c=?", (graph.c,))}
+        inferred.destroy(update_relation=True, update_is_a=True)
+        if not subjects <= abox:
+            onto.destroy()
+            _ONTO = None
+            return
+    for individual in individuals:
+        owlready2.destroy_entity(individual)
+
+
 def test_scenario(name, description, setup_func, expect_consistent):
     """
     Führt ein Testszenario aus und prüft ob der Reasoner das
     erwartete Ergebnis liefert.
     """
-    print(f"\n{SEPARATOR}")
+    print(BANNER)
     print(f"TEST: {name}")
-    print(f"{SEPARATOR}")
+    print(SEPARATOR)
     print(f"Beschreibung: {description}")
     print(f"Erwartung: {'CONSISTENT' if expect_consistent else 'INCONSISTENT (Clash!)'}")
     print()
 
-    # Frische Ontologie für jeden Test
-    onto = create_loan_ontology()
+    # Geteilte TBox, leere ABox
+    onto = loan_ontology()
 
     try:
         with onto:
@@ -175,10 +225,10 @@ def test_scenario(name, description, setup_func, expect_consistent):
 
         # Bewertung
         if is_consistent == expect_consistent:
-            print(f"\n  ✅ TEST BESTANDEN")
+            print("\n  ✅ TEST BESTANDEN")
             return True
         else:
-            print(f"\n  ❌ TEST FEHLGESCHLAGEN")
+            print("\n  ❌ TEST FEHLGESCHLAGEN")
             if expect_consistent:
                 print("     Erwartet: Consistent, aber Reasoner fand Clash")
             else:
@@ -191,8 +241,8 @@ def test_scenario(name, description, setup_func, expect_consistent):
         return False
 
     finally:
-        # Cleanup
-        onto.destroy()
+        # Cleanup: nur die Individuen dieses Szenarios entfernen
+        reset_abox(onto)
 
 
 # ================================================================
@@ -282,6 +332,47 @@ def scenario_4_open_and_closed_end(onto):
     print("    Credit_001 : ClosedEndCredit  ← CLASH! (OpenEnd ⊥ ClosedEnd)")
 
 
+SCENARIOS = [
+    # Test 1: Valide Aussage
+    ("Szenario 1: Gültige Aussage",
+     "CommercialLoan mit FinancialInstitution als Lender → sollte CONSISTENT sein",
+     scenario_1_valid,
+     True),
+
+    # Test 2: SecuredLoan + UnsecuredLoan gleichzeitig
+    ("Szenario 2: Disjointness Clash (Secured ⊥ Unsecured)",
+     "Ein Loan ist gleichzeitig Secured UND Unsecured → INCONSISTENT",
+     scenario_2_disjointness_clash,
+     False),
+
+    # Test 3: NaturalPerson als FinancialInstitution
+    ("Szenario 3: Disjointness Clash (NaturalPerson ⊥ LegalEntity)",
+     "Eine NaturalPerson wird als FinancialInstitution klassifiziert → INCONSISTENT",
+     scenario_3_natural_person_as_legal_entity,
+     False),
+
+    # Test 4: OpenEnd + ClosedEnd gleichzeitig
+    ("Szenario 4: Disjointness Clash (OpenEnd ⊥ ClosedEnd)",
+     "Ein Kredit ist gleichzeitig OpenEnd UND ClosedEnd → INCONSISTENT",
+     scenario_4_open_and_closed_end,
+     False),
+]
+
+
+def _run_one(spec):
+    """
+    Führt ein Szenario in einem Worker-Prozess aus.
+
+    Gibt (Ausgabe, bestanden) zurück, damit sich die Ausgaben paralleler
+    Szenarien nicht vermischen.
+    """
+    name, description, setup_func, expect_consistent = spec
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        passed = test_scenario(name, description, setup_func, expect_consistent)
+    return buffer.getvalue(), passed
+
+
 # ================================================================
 # MAIN
 # ================================================================
@@ -292,42 +383,19 @@ if __name__ == "__main__":
     print("Beweist, dass OWL-DL Reasoning logische Halluzinationen erkennt")
     print(SEPARATOR)
 
-    results = []
+    # Die Szenarien sind unabhängig: jeder Worker-Prozess hat seine eigene
+    # Kopie der Ontologie und startet seine eigene HermiT-JVM
+    with multiprocessing.Pool(min(len(SCENARIOS), os.cpu_count() or 1)) as pool:
+        outcomes = pool.map(_run_one, SCENARIOS)
 
-    # Test 1: Valide Aussage
-    results.append(test_scenario(
-        "Szenario 1: Gültige Aussage",
-        "CommercialLoan mit FinancialInstitution als Lender → sollte CONSISTENT sein",
-        scenario_1_valid,
-        expect_consistent=True
-    ))
-
-    # Test 2: SecuredLoan + UnsecuredLoan gleichzeitig
-    results.append(test_scenario(
-        "Szenario 2: Disjointness Clash (Secured ⊥ Unsecured)",
-        "Ein Loan ist gleichzeitig Secured UND Unsecured → INCONSISTENT",
-        scenario_2_disjointness_clash,
-        expect_consistent=False
-    ))
-
-    # Test 3: NaturalPerson als FinancialInstitution
-    results.append(test_scenario(
-        "Szenario 3: Disjointness Clash (NaturalPerson ⊥ LegalEntity)",
-        "Eine NaturalPerson wird als FinancialInstitution klassifiziert → INCONSISTENT",
-        scenario_3_natural_person_as_legal_entity,
-        expect_consistent=False
-    ))
-
-    # Test 4: OpenEnd + ClosedEnd gleichzeitig
-    results.append(test_scenario(
-        "Szenario 4: Disjointness Clash (OpenEnd ⊥ ClosedEnd)",
-        "Ein Kredit ist gleichzeitig OpenEnd UND ClosedEnd → INCONSISTENT",
-        scenario_4_open_and_closed_end,
-        expect_consistent=False
-    ))
+    # Ausgaben in Szenario-Reihenfolge, nicht in Abschlussreihenfolge
+    results = []
+    for output, result in outcomes:
+        print(output, end="")
+        results.append(result)
 
     # Zusammenfassung
-    print(f"\n{SEPARATOR}")
+    print(BANNER)
     print("ZUSAMMENFASSUNG")
     print(SEPARATOR)
 
@@ -0,0 +1,170 @@
+"""
+test_rate_limiter.py
+Tests für den clientseitigen Rate Limiter (rate_limiter.py)
+
+Uhr, Schlafen, Jitter und RateLimitError werden ersetzt, damit die Tests
+ohne Wartezeit und ohne OpenAI-Aufrufe laufen.
+"""
+
+import os
+import sys
+
+_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(_root, 'src'))
+sys.path.insert(0, _root)
+
+import rate_limiter
+from rate_limiter import MAX_ATTEMPTS, RateLimiter
+
+
+SEPARATOR = "=" * 70
+
+
+class FakeClock:
+    """Ersatz für das time-Modul: sleep() stellt die Uhr nur vor."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeRateLimitError(Exception):
+    """Ersatz für openai.RateLimitError (429)."""
+
+
+def _patched(test):
+    """Führt test(clock) mit Fake-Uhr, ohne Jitter und mit Fake-429 aus."""
+    originals = (rate_limiter.time, rate_limiter.random, rate_limiter.RateLimitError)
+    clock = FakeClock()
+    rate_limiter.time = clock
+    rate_limiter.random = type("NoJitter", (), {"random": staticmethod(lambda: 0.0)})
+    rate_limiter.RateLimitError = FakeRateLimitError
+    try:
+        return test(clock)
+    finally:
+        rate_limiter.time, rate_limiter.random, rate_limiter.RateLimitError = originals
+
+
+def test_rpm_bucket_refills():
+    """Test: Nach einer Minute Anfragen wird bis zum Nachfüllen gewartet."""
+    print(f"\n{SEPARATOR}")
+    print("TEST: RPM-Limit")
+    print(SEPARATOR)
+
+    def run(clock):
+        limiter = RateLimiter(rpm=60)
+        for _ in range(60):
+            limiter.acquire()
+        assert clock.now == 0.0, "Volle Bucket sollte nicht warten"
+
+        limiter.acquire()
+        print(f"  61. Anfrage nach {clock.now:.1f}s")
+        assert clock.now == 1.0, f"Erwartet: 1s Wartezeit, war {clock.now}s"
+        assert limiter.waited == 1.0
+
+    _patched(run)
+    print("\n  ✅ TEST BESTANDEN")
+    return True
+
+
+def test_tpm_bucket_refills():
+    """Test: Token-Budget wird über die Zeit nachgefüllt."""
+    print(f"\n{SEPARATOR}")
+    print("TEST: TPM-Limit")
+    print(SEPARATOR)
+
+    def run(clock):
+        limiter = RateLimiter(tpm=1000)
+        limiter.acquire(tokens=800)
+        assert clock.now == 0.0
+
+        # 200 Tokens übrig, 600 fehlen: 600 * 60 / 1000 = 36s
+        limiter.acquire(tokens=800)
+        print(f"  Zweite Anfrage nach {clock.now:.1f}s")
+        assert abs(clock.now - 36.0) < 1e-9, f"Erwartet: 36s Wartezeit, war {clock.now}s"
+
+        # Größer als die ganze Bucket: wartet auf eine volle Bucket
+        limiter.acquire(tokens=5000)
+        assert abs(clock.now - 96.0) < 1e-9, f"Erwartet: 96s gesamt, war {clock.now}s"
+
+    _patched(run)
+    print("\n  ✅ TEST BESTANDEN")
+    return True
+
+
+def test_retries_stop_at_attempt_limit():
+    """Test: 429-Fehler werden mit Backoff wiederholt, höchstens MAX_ATTEMPTS-mal."""
+    print(f"\n{SEPARATOR}")
+    print("TEST: Retries bei RateLimitError")
+    print(SEPARATOR)
+
+    def run(clock):
+        limiter = RateLimiter()
+        calls = []
+
+        def always_429():
+            calls.append(clock.now)
+            raise FakeRateLimitError()
+
+        try:
+            limiter.call(always_429)
+        except FakeRateLimitError:
+            pass
+        else:
+            raise AssertionError("RateLimitError nach dem letzten Versuch erwartet")
+
+        print(f"  Versuche: {len(calls)}, Backoff: {clock.sleeps}")
+        assert len(calls) == MAX_ATTEMPTS
+        assert limiter.retries == MAX_ATTEMPTS - 1
+        assert clock.sleeps == [2.0 ** i for i in range(MAX_ATTEMPTS - 1)]
+
+        attempts = []
+
+        def third_time_lucky(value):
+            attempts.append(value)
+            if len(attempts) < 3:
+                raise FakeRateLimitError()
+            return value
+
+        assert limiter.call(third_time_lucky, "ok") == "ok"
+        assert len(attempts) == 3
+        assert limiter.retries == MAX_ATTEMPTS - 1 + 2
+
+    _patched(run)
+    print("\n  ✅ TEST BESTANDEN")
+    return True
+
+
+if __name__ == "__main__":
+    results = []
+
+    results.append(("RPM-Limit", test_rpm_bucket_refills()))
+    results.append(("TPM-Limit", test_tpm_bucket_refills()))
+    results.append(("Retry-Limit", test_retries_stop_at_attempt_limit()))
+
+    # Zusammenfassung
+    print(f"\n{SEPARATOR}")
+    print("ZUSAMMENFASSUNG")
+    print(SEPARATOR)
+
+    passed = sum(1 for _, r in results if r)
+    total = len(results)
+
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"  {status}  {name}")
+
+    print(f"\nErgebnis: {passed}/{total} Tests bestanden")
+
+    if passed == total:
+        print("\n🎉 ALLE TESTS BESTANDEN!")
+    else:
+        print("\n⚠️  NICHT ALLE TESTS BESTANDEN")
+        exit(1)
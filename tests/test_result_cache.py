@@ -0,0 +1,127 @@
+"""
+test_result_cache.py
+Tests für den persistenten Result-Cache (result_cache.py)
+"""
+
+import os
+import sys
+import tempfile
+
+_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(_root, 'src'))
+sys.path.insert(0, _root)
+
+import result_cache
+from result_cache import ResultCache, canonical_triples
+
+
+SEPARATOR = "=" * 70
+
+TRIPLES = [
+    {"sub": "Loan_1", "pred": "hasBorrower", "obj": "Müller GmbH",
+     "sub_type": "Loan", "obj_type": "LegalEntity"},
+    {"sub": "Loan_1", "pred": "rdf:type", "obj": "SecuredLoan",
+     "sub_type": "Loan", "obj_type": "Class"},
+]
+
+
+def test_make_key_is_stable():
+    """Test: Cache-Keys hängen nur von den Teilen ab, nicht vom Prozess."""
+    print(f"\n{SEPARATOR}")
+    print("TEST: make_key ist stabil")
+    print(SEPARATOR)
+
+    key = ResultCache.make_key("extract", "gpt-4o", "prompt", "text")
+    print(f"  Key: {key}")
+
+    # Fester Wert: eine Änderung am Key-Schema entwertet alle Caches
+    assert key == "6d84d1dedef7d2778d5d78a7ac081d68", f"Key hat sich geändert: {key}"
+    assert ResultCache.make_key("ab", "c") != ResultCache.make_key("a", "bc"), \
+        "Teilgrenzen müssen in den Key eingehen"
+    print("\n  ✅ TEST BESTANDEN")
+    return True
+
+
+def test_canonical_triples_with_and_without_orjson():
+    """Test: canonical_triples ist reihenfolgeunabhängig und gleich mit/ohne orjson."""
+    print(f"\n{SEPARATOR}")
+    print("TEST: canonical_triples mit und ohne orjson")
+    print(SEPARATOR)
+
+    original = result_cache.orjson
+    try:
+        result_cache.orjson = None
+        fallback = canonical_triples(TRIPLES)
+        assert fallback == canonical_triples(TRIPLES[::-1]), "Reihenfolge beeinflusst den Key"
+    finally:
+        result_cache.orjson = original
+    print(f"  json:   {fallback}")
+
+    if original is None:
+        print("  orjson nicht installiert, Vergleich übersprungen")
+    else:
+        fast = canonical_triples(TRIPLES)
+        print(f"  orjson: {fast}")
+        assert fast == fallback, "orjson und json liefern unterschiedliche Keys"
+    print("\n  ✅ TEST BESTANDEN")
+    return True
+
+
+def test_get_set_round_trip():
+    """Test: Gespeicherte Werte überleben das Schließen und Neuöffnen."""
+    print(f"\n{SEPARATOR}")
+    print("TEST: get/set Round-Trip")
+    print(SEPARATOR)
+
+    value = {"triples": TRIPLES, "success": True}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ResultCache(cache_dir)
+        key = cache.make_key("validate", canonical_triples(TRIPLES))
+        assert cache.get(key) is None, "Leerer Cache liefert einen Treffer"
+        cache.set(key, value)
+        cache.close()
+
+        cache = ResultCache(cache_dir)
+        assert cache.get(key) == value, "Wert nach Neuöffnen verändert"
+
+        # Nicht mehr lesbare Einträge zählen als Miss
+        with cache._lock:
+            cache._conn.execute(
+                "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                ("broken", b"not a pickle"),
+            )
+        assert cache.get("broken") is None, "Defekter Eintrag liefert einen Treffer"
+
+        print(f"  Hits: {cache.hits}, Misses: {cache.misses}")
+        assert (cache.hits, cache.misses) == (1, 1)
+        cache.close()
+    print("\n  ✅ TEST BESTANDEN")
+    return True
+
+
+if __name__ == "__main__":
+    results = []
+
+    results.append(("make_key stabil", test_make_key_is_stable()))
+    results.append(("canonical_triples", test_canonical_triples_with_and_without_orjson()))
+    results.append(("get/set Round-Trip", test_get_set_round_trip()))
+
+    # Zusammenfassung
+    print(f"\n{SEPARATOR}")
+    print("ZUSAMMENFASSUNG")
+    print(SEPARATOR)
+
+    passed = sum(1 for _, r in results if r)
+    total = len(results)
+
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"  {status}  {name}")
+
+    print(f"\nErgebnis: {passed}/{total} Tests bestanden")
+
+    if passed == total:
+        print("\n🎉 ALLE TESTS BESTANDEN!")
+    else:
+        print("\n⚠️  NICHT ALLE TESTS BESTANDEN")
+        exit(1)
@@ -17,6 +17,7 @@ Requires:
 - LOAN ontology files in ./ontologies/
 """
 
+import functools
 import os
 import sys
 from pathlib import Path
@@ -25,10 +26,6 @@ _root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
 sys.path.insert(0, os.path.join(_root, 'src'))
 sys.path.insert(0, _root)
 
-from dotenv import load_dotenv
-
-load_dotenv()
-
 SEPARATOR = "=" * 70
 
 # Phase 2 required fields in result dict
@@ -46,8 +43,39 @@ PHASE2_FIELDS = [
 ]
 
 
+def _ovrag_system():
+    """
+    Load .env and import OVRAGSystem on first use.
+
+    Keeps dotenv and the whole pipeline (LangChain, owlready2, OpenAI)
+    out of pytest collection; main is imported once and then cached.
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    from main import OVRAGSystem
+    return OVRAGSystem
+
+
+@functools.lru_cache(maxsize=4)
+def _system_for(pdf_paths: tuple):
+    """
+    OVRAGSystem with the given PDFs (relative to the repo root) loaded.
+
+    Shared by the scenarios so each PDF set is parsed and embedded once;
+    process_query() keeps no per-query state on the system.
+    """
+    OVRAGSystem = _ovrag_system()
+    system = OVRAGSystem()
+    system.load_documents([os.path.join(_root, p) for p in pdf_paths])
+    return system
+
+
 def check_prerequisites():
     """Verify all prerequisites are met."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
     if not os.getenv("OPENAI_API_KEY"):
         print("[X] OPENAI_API_KEY not set")
         sys.exit(1)
@@ -79,14 +107,11 @@ def test_scenario_1_first_attempt_pass():
     Contract_001 (ConsumerLoan) contains no contradictions.
     The system should generate a valid answer on the first try.
     """
-    from main import OVRAGSystem
-
     print(f"\n{SEPARATOR}")
     print("SCENARIO 1: First-Attempt Pass (Contract_001 ConsumerLoan)")
     print(SEPARATOR)
 
-    system = OVRAGSystem()
-    system.load_documents([os.path.join(_root, "data/Contract_001.pdf")])
+    system = _system_for(("data/Contract_001.pdf",))
 
     result = system.process_query("Who is the borrower of this consumer loan?")
 
@@ -147,14 +172,11 @@ def test_scenario_2_correction_loop():
     contradictions that should cause validation failures.
     The system should attempt corrections and eventually hard-reject.
     """
-    from main import OVRAGSystem
-
     print(f"\n{SEPARATOR}")
     print("SCENARIO 2: Correction Loop (Contract_010 ERROR_CLASH)")
     print(SEPARATOR)
 
-    system = OVRAGSystem()
-    system.load_documents([os.path.join(_root, "data/Contract_010.pdf")])
+    system = _system_for(("data/Contract_010.pdf",))
 
     result = system.process_query(
         "Who is the lender for this commercial loan?"
@@ -203,14 +225,11 @@ def test_scenario_3_logging_structure():
     Each entry in correction_attempts must have:
     attempt_number, answer, triples, is_valid, explanation
     """
-    from main import OVRAGSystem
-
     print(f"\n{SEPARATOR}")
     print("SCENARIO 3: Correction Attempt Logging Structure")
     print(SEPARATOR)
 
-    system = OVRAGSystem()
-    system.load_documents([os.path.join(_root, "data/Contract_001.pdf")])
+    system = _system_for(("data/Contract_001.pdf",))
 
     result = system.process_query(
         "Who is the borrower of this loan and what type of loan is it? Is it secured or unsecured?"
@@ -256,14 +275,11 @@ def test_scenario_4_phase2_fields():
     """
     Scenario 4: Result dict contains all Phase 2 fields.
     """
-    from main import OVRAGSystem
-
     print(f"\n{SEPARATOR}")
     print("SCENARIO 4: Phase 2 Result Fields")
     print(SEPARATOR)
 
-    system = OVRAGSystem()
-    system.load_documents([os.path.join(_root, "data/Contract_001.pdf")])
+    system = _system_for(("data/Contract_001.pdf",))
 
     result = system.process_query("What is the interest rate?")
 
@@ -0,0 +1,149 @@
+"""
+test_validator_isolation.py
+Tests: Validierungen teilen sich eine World, ohne sich gegenseitig zu beeinflussen
+
+Der Validator lädt die LOAN-Ontologie einmal und räumt nach jeder
+Validierung die temporäre ABox und die Reasoner-Inferenzen wieder ab.
+"""
+
+import os
+import sys
+
+_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(_root, 'src'))
+sys.path.insert(0, _root)
+
+from validator import OntologyValidator
+
+
+SEPARATOR = "=" * 70
+
+TRIPLES = [
+    {"sub": "Loan_1", "pred": "rdf:type", "obj": "SecuredLoan",
+     "sub_type": "Loan", "obj_type": "Class"},
+    {"sub": "Loan_1", "pred": "rdf:type", "obj": "UnsecuredLoan",
+     "sub_type": "Loan", "obj_type": "Class"},
+]
+
+_TEMP_IRI, _INFERRED_IRI = OntologyValidator._VALIDATION_ONTOLOGY_IRIS
+
+
+def _names(entities):
+    return sorted(str(e) for e in entities)
+
+
+def _verdict(result):
+    """Ergebnis ohne die rohe Reasoner-Ausgabe (enthält Zeitstempel)."""
+    explanation = result.explanation.split("Reasoner output:")[0]
+    return result.is_valid, explanation, result.inconsistent_triples
+
+
+def test_same_triples_validated_twice():
+    """Test: Zweimal dieselben Triples ergeben zweimal dasselbe Ergebnis."""
+    print(f"\n{SEPARATOR}")
+    print("TEST: Gleiche Triples zweimal hintereinander validieren")
+    print(SEPARATOR)
+
+    validator = OntologyValidator(ontology_dir=os.path.join(_root, "ontologies"))
+
+    first = validator.validate_triples(TRIPLES)
+    second = validator.validate_triples(TRIPLES)
+
+    print(f"  1. Lauf: valid={first.is_valid}")
+    print(f"  2. Lauf: valid={second.is_valid}")
+
+    assert _verdict(first) == _verdict(second), "Zweite Validierung weicht von der ersten ab"
+    for iri in OntologyValidator._VALIDATION_ONTOLOGY_IRIS:
+        assert validator.world.ontologies.get(iri) is None, f"{iri} nicht entfernt"
+    print("\n  ✅ TEST BESTANDEN")
+    return True
+
+
+def test_inferred_tbox_axiom_forces_reload():
+    """Test: Inferenzen über TBox-Klassen erzwingen eine frische World."""
+    print(f"\n{SEPARATOR}")
+    print("TEST: Inferenzen auf TBox-Ebene werden nicht weitergereicht")
+    print(SEPARATOR)
+
+    validator = OntologyValidator(ontology_dir=os.path.join(_root, "ontologies"))
+    validator._prepare_world()
+    secured = validator._get_class_by_name("SecuredLoan")
+    unsecured = validator._get_class_by_name("UnsecuredLoan")
+    original_is_a = _names(secured.is_a)
+
+    # Nur ABox-Inferenzen: die World bleibt wiederverwendbar
+    temp_onto = validator.world.get_ontology(_TEMP_IRI)
+    with temp_onto:
+        loan = secured("Loan_1")
+    with validator.world.get_ontology(_INFERRED_IRI):
+        loan.is_a.append(unsecured)
+    validator._discard_validation_state()
+    print(f"  Nach ABox-Inferenz wiederverwendbar: {validator._world_reusable}")
+    assert validator._world_reusable, "ABox-Inferenz sollte keinen Reload auslösen"
+
+    # Simulierte Reasoner-Ausgabe: neue Oberklasse einer TBox-Klasse
+    with validator.world.get_ontology(_INFERRED_IRI):
+        secured.is_a.append(unsecured)
+    validator._discard_validation_state()
+    print(f"  Nach TBox-Inferenz wiederverwendbar: {validator._world_reusable}")
+    assert not validator._world_reusable, "TBox-Inferenz muss einen Reload auslösen"
+
+    validator._prepare_world()
+    reloaded = validator._get_class_by_name("SecuredLoan")
+    print(f"  is_a vorher:  {original_is_a}")
+    print(f"  is_a nachher: {_names(reloaded.is_a)}")
+    assert _names(reloaded.is_a) == original_is_a, "TBox nach Reload verändert"
+    print("\n  ✅ TEST BESTANDEN")
+    return True
+
+
+def test_incomplete_reasoning_is_flagged():
+    """Test: Ohne Reasoner-Lauf ist ein Ergebnis als unvollständig markiert."""
+    print(f"\n{SEPARATOR}")
+    print("TEST: reasoning_complete ohne lauffähigen Reasoner")
+    print(SEPARATOR)
+
+    validator = OntologyValidator(ontology_dir=os.path.join(_root, "ontologies"))
+    # Reasoner nicht verfügbar (z.B. kein java im PATH)
+    validator._run_reasoner_with_fallback = lambda: False
+    result = validator.validate_triples(TRIPLES)
+    print(f"  Clash-Triples: valid={result.is_valid}, "
+          f"reasoning_complete={result.reasoning_complete}")
+    assert not result.reasoning_complete, "Ergebnis ohne Reasoner darf nicht als vollständig gelten"
+
+    # Triples ohne Bezug zur Ontologie brauchen keinen Reasoner
+    ungrounded = [{"sub": "Foo", "pred": "likes", "obj": "Bar",
+                   "sub_type": "Unknown", "obj_type": "Unknown"}]
+    result = validator.validate_triples(ungrounded)
+    print(f"  Ohne Ontologie-Bezug: reasoning_complete={result.reasoning_complete}")
+    assert result.reasoning_complete, "Übersprungener Reasoner gilt als vollständig"
+    print("\n  ✅ TEST BESTANDEN")
+    return True
+
+
+if __name__ == "__main__":
+    results = []
+
+    results.append(("Gleiches Ergebnis zweimal", test_same_triples_validated_twice()))
+    results.append(("TBox-Inferenz → Reload", test_inferred_tbox_axiom_forces_reload()))
+    results.append(("Unvollständiges Reasoning", test_incomplete_reasoning_is_flagged()))
+
+    # Zusammenfassung
+    print(f"\n{SEPARATOR}")
+    print("ZUSAMMENFASSUNG")
+    print(SEPARATOR)
+
+    passed = sum(1 for _, r in results if r)
+    total = len(results)
+
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"  {status}  {name}")
+
+    print(f"\nErgebnis: {passed}/{total} Tests bestanden")
+
+    if passed == total:
+        print("\n🎉 ALLE TESTS BESTANDEN!")
+    else:
+        print("\n⚠️  NICHT ALLE TESTS BESTANDEN")
+        exit(1)